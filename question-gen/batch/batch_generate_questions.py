@@ -17,8 +17,10 @@ option-a.svg … option-e.svg and question_meta.json into that directory.
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -96,22 +98,25 @@ def main() -> None:
     questions: list[dict] = []
     base_dir = output_dir.name
 
+    # Each question is an independent subprocess, so run them through a
+    # bounded pool and collect in submission order. Threads are enough:
+    # the work happens in the child processes, not in this interpreter.
+    jobs: list[tuple[str, Path, list[str]]] = []
     for i, seed in enumerate(seeds):
         qid = f"{args.id_prefix}{str(i + 1).zfill(args.id_width)}"
         question_dir = output_dir / qid
         question_dir.mkdir(parents=True, exist_ok=True)
+        jobs.append(
+            (
+                qid,
+                question_dir,
+                [sys.executable, str(template_path), "--seed", str(seed), "-o", str(question_dir)],
+            )
+        )
 
-        cmd = [
-            sys.executable,
-            str(template_path),
-            "--seed",
-            str(seed),
-            "-o",
-            str(question_dir),
-        ]
-        print(f"[{i + 1}/{len(seeds)}] {qid} (seed={seed}) … ", end="", flush=True)
+    def run_template(cmd: list[str]) -> subprocess.CompletedProcess | None:
         try:
-            result = subprocess.run(
+            return subprocess.run(
                 cmd,
                 cwd=SCRIPT_DIR,
                 capture_output=True,
@@ -119,32 +124,41 @@ def main() -> None:
                 timeout=SUBPROCESS_TIMEOUT,
             )
         except subprocess.TimeoutExpired:
-            print("TIMEOUT")
-            raise SystemExit(f"Template timed out for {qid}.")
-        if result.returncode != 0:
-            print("FAILED")
-            if result.stderr:
-                sys.stderr.write(result.stderr)
-            raise SystemExit(f"Template failed for {qid} (exit {result.returncode}).")
-
-        meta_path = question_dir / META_FILENAME
-        if not meta_path.exists():
-            raise SystemExit(f"Template did not write {META_FILENAME} in {question_dir}.")
-
-        with open(meta_path, encoding="utf-8") as f:
-            meta = json.load(f)
-
-        entry = {
-            "id": qid,
-            "template_id": meta.get("template_id", args.template.stem.replace("gen_question_", "").replace("_template", "")),
-            "correct_index": meta["correct_index"],
-            "option_files": meta.get("option_files", STANDARD_OPTION_FILES),
-            "question_text": meta.get("question_text"),
-            "explanation": meta.get("explanation"),
-            "seed": meta.get("seed", seed),
-        }
-        questions.append(entry)
-        print("ok")
+            return None
+
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_template, cmd) for _, _, cmd in jobs]
+        for i, ((qid, question_dir, _), seed, future) in enumerate(zip(jobs, seeds, futures)):
+            print(f"[{i + 1}/{len(seeds)}] {qid} (seed={seed}) … ", end="", flush=True)
+            result = future.result()
+            if result is None:
+                print("TIMEOUT")
+                raise SystemExit(f"Template timed out for {qid}.")
+            if result.returncode != 0:
+                print("FAILED")
+                if result.stderr:
+                    sys.stderr.write(result.stderr)
+                raise SystemExit(f"Template failed for {qid} (exit {result.returncode}).")
+
+            meta_path = question_dir / META_FILENAME
+            if not meta_path.exists():
+                raise SystemExit(f"Template did not write {META_FILENAME} in {question_dir}.")
+
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+
+            entry = {
+                "id": qid,
+                "template_id": meta.get("template_id", args.template.stem.replace("gen_question_", "").replace("_template", "")),
+                "correct_index": meta["correct_index"],
+                "option_files": meta.get("option_files", STANDARD_OPTION_FILES),
+                "question_text": meta.get("question_text"),
+                "explanation": meta.get("explanation"),
+                "seed": meta.get("seed", seed),
+            }
+            questions.append(entry)
+            print("ok")
 
     manifest = {"base_dir": base_dir, "questions": questions}
     manifest_path = output_dir / MANIFEST_FILENAME
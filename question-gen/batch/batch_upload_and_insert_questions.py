@@ -16,29 +16,142 @@ With --dry-run: only validates manifest and lists what would be uploaded/inserte
 """
 
 import argparse
+import contextlib
+import csv
+import functools
+import gzip
+import http.client
+import io
 import json
 import os
 import sys
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+_STANDARD_OPTION_FILES = ["option-a.svg", "option-b.svg", "option-c.svg", "option-d.svg", "option-e.svg"]
+
+# Content types by file suffix (JPEGs were previously mislabelled image/png)
+_CONTENT_TYPES = {
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+# Caps total in-flight PUTs across the per-question and per-file pools so
+# nested concurrency cannot exhaust the shared client's connection pool.
+_PUT_SEMAPHORE = threading.Semaphore(32)
+
+# Per-thread persistent connections for the REST upload path: reusing the
+# socket keeps the TLS session alive across PUTs instead of paying a fresh
+# handshake per file.
+_REST_CONNS = threading.local()
+
+
+def _rest_connection(scheme: str, netloc: str):
+    conns = getattr(_REST_CONNS, "by_host", None)
+    if conns is None:
+        conns = _REST_CONNS.by_host = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = cls(netloc)
+    return conn
+
+
+def _rest_request(scheme: str, netloc: str, method: str, path: str, data, headers: dict) -> tuple[int, str, dict]:
+    """Send a request over the calling thread's persistent connection; retry once on a stale socket (server closed the keep-alive between requests)."""
+    for attempt in (0, 1):
+        conn = _rest_connection(scheme, netloc)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read().decode("utf-8", errors="replace"), dict(resp.getheaders())
+        except (http.client.HTTPException, ConnectionError, OSError):
+            conn.close()
+            _REST_CONNS.by_host.pop((scheme, netloc), None)
+            if attempt:
+                raise
+            if hasattr(data, "seek"):
+                data.seek(0)
+    raise AssertionError("unreachable")
+
+
+try:
+    import orjson  # optional: parses the bytes directly, no decode-then-parse pass
+except ImportError:
+    orjson = None
+
+try:
+    from tqdm import tqdm  # optional: one coalesced progress bar instead of a print (two flush syscalls) per question
+except ImportError:
+    tqdm = None
+
+try:
+    import ijson  # optional: stream-parses the manifest instead of materializing the whole document
+except ImportError:
+    ijson = None
+
+# The only per-question manifest fields this script reads; everything else is
+# dropped at parse time so a fat manifest does not stay resident.
+_QUESTION_FIELDS = ("id", "correct_index", "option_files", "question_text", "explanation")
+
+
+def _slim_question(q: dict) -> dict:
+    return {k: q[k] for k in _QUESTION_FIELDS if k in q}
+
 
 def _load_manifest(path: Path) -> dict:
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load the manifest keeping only the fields script 2 uses. With ijson the questions array is decoded one entry at a time, so peak memory is the slimmed list, not the full parse tree."""
+    if ijson is not None:
+        with open(path, "rb") as f:
+            questions = [_slim_question(q) for q in ijson.items(f, "questions.item")]
+        with open(path, "rb") as f:
+            base_dir = next(ijson.items(f, "base_dir"), "questions")
+        return {"base_dir": base_dir, "questions": questions}
+    if orjson is not None:
+        manifest = orjson.loads(path.read_bytes())
+    else:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    manifest["questions"] = [_slim_question(q) for q in manifest.get("questions", [])]
+    return manifest
+
+
+@functools.lru_cache(maxsize=1)
+def _transfer_config():
+    """Transfer settings for client.upload_file: files over 8 MiB are split into 8 MiB parts uploaded concurrently; smaller files go as a single PUT."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=10,
+        use_threads=True,
+    )
 
 
-def _upload_supabase_s3(
-    question_dir: Path,
-    qid: str,
-    bucket: str,
-    prefix: str,
-    base_url: str,
-) -> str:
-    """Upload via Supabase Storage S3-compatible API (use Access Key + Secret Key from supabase status)."""
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+def _get_s3_client():
+    """One shared boto3 client for all upload workers. boto3 clients are thread-safe to use, but not to construct concurrently, so the first caller builds it under a lock (client creation also parses megabytes of service models — worth doing exactly once). A shared connection pool is what lets concurrent uploads overlap their round-trips."""
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                _S3_CLIENT = _build_s3_client()
+    return _S3_CLIENT
+
+
+def _build_s3_client():
     api_url = (os.environ.get("SUPABASE_URL") or "").rstrip("/")
     s3_url = os.environ.get("SUPABASE_STORAGE_S3_URL") or f"{api_url}/storage/v1/s3"
     access = os.environ.get("SUPABASE_STORAGE_ACCESS_KEY")
@@ -53,35 +166,78 @@ def _upload_supabase_s3(
         from botocore.config import Config
     except ImportError:
         raise SystemExit("S3 upload requires boto3: pip install boto3")
-    client = boto3.client(
+    return boto3.client(
         "s3",
         endpoint_url=s3_url,
         aws_access_key_id=access,
         aws_secret_access_key=secret,
         region_name=region,
-        config=Config(signature_version="s3v4"),
+        config=Config(signature_version="s3v4", max_pool_connections=32),
     )
+
+
+def _upload_supabase_s3(
+    files: list[Path],
+    qid: str,
+    bucket: str,
+    prefix: str,
+    base_url: str,
+    skip_existing: bool = False,
+) -> str:
+    """Upload via Supabase Storage S3-compatible API (use Access Key + Secret Key from supabase status)."""
+    client = _get_s3_client()
     folder_prefix = f"{prefix.rstrip('/')}/{qid}" if prefix else qid
-    for f in question_dir.iterdir():
-        if f.is_file() and f.suffix.lower() in (".svg", ".png", ".jpg", ".jpeg"):
-            object_path = f"{folder_prefix}/{f.name}"
-            data = f.read_bytes()
-            content_type = "image/svg+xml" if f.suffix.lower() == ".svg" else "image/png"
-            client.put_object(
-                Bucket=bucket,
-                Key=object_path,
-                Body=data,
-                ContentType=content_type,
-            )
-    return f"{base_url.rstrip('/')}/{qid}"
+
+    def _already_uploaded(key: str, f: Path, content_type: str) -> bool:
+        try:
+            meta = client.head_object(Bucket=bucket, Key=key)
+        except client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                raise
+            return False
+        # SVGs are stored gzipped, so their stored size never matches the
+        # file on disk; existence is the best cheap check for them.
+        return content_type == "image/svg+xml" or meta.get("ContentLength") == f.stat().st_size
+
+    def put_one(f: Path) -> None:
+        key = f"{folder_prefix}/{f.name}"
+        content_type = _CONTENT_TYPES.get(f.suffix.lower(), "application/octet-stream")
+        if not f.is_file():
+            raise SystemExit(f"Option file listed in manifest not found: {f}")
+        with _PUT_SEMAPHORE:
+            if skip_existing and _already_uploaded(key, f, content_type):
+                return
+            if content_type == "image/svg+xml":
+                # SVGs are small text and compress ~5x; send them gzipped.
+                client.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=gzip.compress(f.read_bytes()),
+                    ContentType=content_type,
+                    ContentEncoding="gzip",
+                )
+            else:
+                # upload_file streams from disk and switches to concurrent
+                # multipart for large files (see _transfer_config).
+                client.upload_file(
+                    str(f), bucket, key,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=_transfer_config(),
+                )
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(5, len(files))) as pool:
+            list(pool.map(put_one, files))
+    return f"{base_url}/{qid}"
 
 
 def _upload_supabase_rest(
-    question_dir: Path,
+    files: list[Path],
     qid: str,
     bucket: str,
     prefix: str,
     base_url: str,
+    skip_existing: bool = False,
 ) -> str:
     """Upload via Supabase Storage REST API (requires service_role JWT, not sb_secret_ keys)."""
     api_url = (os.environ.get("SUPABASE_URL") or "").rstrip("/")
@@ -91,106 +247,212 @@ def _upload_supabase_rest(
             "REST upload requires SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (JWT)."
         )
     folder_prefix = f"{prefix.rstrip('/')}/{qid}" if prefix else qid
-    for f in question_dir.iterdir():
-        if f.is_file() and f.suffix.lower() in (".svg", ".png", ".jpg", ".jpeg"):
-            object_path = f"{folder_prefix}/{f.name}"
-            data = f.read_bytes()
-            content_type = "image/svg+xml" if f.suffix.lower() == ".svg" else "image/png"
-            upload_url = f"{api_url}/storage/v1/object/{bucket}/{object_path}"
-            req = urllib.request.Request(
-                upload_url,
-                data=data,
-                headers={
-                    "apikey": key,
-                    "Authorization": f"Bearer {key}",
-                    "Content-Type": content_type,
-                    "x-upsert": "true",
-                },
-                method="POST",
-            )
-            try:
-                urllib.request.urlopen(req)
-            except urllib.error.HTTPError as e:
-                body = e.read().decode("utf-8", errors="replace") if e.fp else ""
-                msg = f"Storage upload failed {e.code} {upload_url}\n{body}"
-                if "Invalid Compact JWS" in body or "403" in body:
-                    msg += "\nUse S3 keys instead: set SUPABASE_STORAGE_ACCESS_KEY and SUPABASE_STORAGE_SECRET_KEY from 'supabase status' (Storage)."
-                raise SystemExit(msg)
-    return f"{base_url.rstrip('/')}/{qid}"
+    split = urllib.parse.urlsplit(api_url)
+
+    def put_one(f: Path) -> None:
+        content_type = _CONTENT_TYPES.get(f.suffix.lower(), "application/octet-stream")
+        if not f.is_file():
+            raise SystemExit(f"Option file listed in manifest not found: {f}")
+        object_path = f"{split.path.rstrip('/')}/storage/v1/object/{bucket}/{folder_prefix}/{f.name}"
+        headers = {
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+            "Content-Type": content_type,
+            "x-upsert": "true",
+        }
+        with _PUT_SEMAPHORE:
+            if skip_existing:
+                head_status, _, head_headers = _rest_request(
+                    split.scheme, split.netloc, "HEAD", object_path,
+                    None, {"apikey": key, "Authorization": f"Bearer {key}"},
+                )
+                # SVGs are stored gzipped, so size never matches the file on
+                # disk; existence is the best cheap check for them.
+                if head_status == 200 and (
+                    content_type == "image/svg+xml"
+                    or head_headers.get("Content-Length") == str(f.stat().st_size)
+                ):
+                    return
+            if content_type == "image/svg+xml":
+                payload = gzip.compress(f.read_bytes())
+                headers["Content-Encoding"] = "gzip"
+                headers["Content-Length"] = str(len(payload))
+                status, body, _ = _rest_request(split.scheme, split.netloc, "POST", object_path, payload, headers)
+            else:
+                # Stream the file body; Content-Length avoids chunked encoding.
+                headers["Content-Length"] = str(f.stat().st_size)
+                with f.open("rb") as fh:
+                    status, body, _ = _rest_request(split.scheme, split.netloc, "POST", object_path, fh, headers)
+        if status >= 300:
+            msg = f"Storage upload failed {status} {api_url}{object_path[len(split.path.rstrip(chr(47))):]}\n{body}"
+            if "Invalid Compact JWS" in body or "403" in body:
+                msg += "\nUse S3 keys instead: set SUPABASE_STORAGE_ACCESS_KEY and SUPABASE_STORAGE_SECRET_KEY from 'supabase status' (Storage)."
+            raise SystemExit(msg)
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(5, len(files))) as pool:
+            list(pool.map(put_one, files))
+    return f"{base_url}/{qid}"
 
 
 def _upload_supabase(
-    question_dir: Path,
+    files: list[Path],
     qid: str,
     bucket: str,
     prefix: str,
     base_url: str,
+    skip_existing: bool = False,
 ) -> str:
     """Upload to Supabase Storage. Prefers S3 API when Storage keys are set (for local sb_secret_ setups)."""
     if os.environ.get("SUPABASE_STORAGE_ACCESS_KEY") and os.environ.get("SUPABASE_STORAGE_SECRET_KEY"):
-        return _upload_supabase_s3(question_dir, qid, bucket, prefix, base_url)
-    return _upload_supabase_rest(question_dir, qid, bucket, prefix, base_url)
+        return _upload_supabase_s3(files, qid, bucket, prefix, base_url, skip_existing=skip_existing)
+    return _upload_supabase_rest(files, qid, bucket, prefix, base_url, skip_existing=skip_existing)
 
 
-def _insert_question_and_options(
+def _bulk_insert_questions(
     cursor,
-    question: dict,
-    base_url: str,
+    questions: list[dict],
     subject_id: int,
     topic_id: int,
     question_type: str = "multiple_choice",
     points: int = 1,
     time_limit_seconds: int = 90,
-) -> int:
-    """Insert one question and its 5 answer_options. Return question id."""
-    qid = question["id"]
-    question_base_url = f"{base_url.rstrip('/')}/{qid}"
-    question_text = question.get("question_text") or "Which shape is the odd one out?"
-    explanation = question.get("explanation")
-    correct_index = question["correct_index"]
-    option_files = question.get("option_files", ["option-a.svg", "option-b.svg", "option-c.svg", "option-d.svg", "option-e.svg"])
-
-    cursor.execute(
-        """
-        INSERT INTO questions (
-            subject_id, topic_id, question_type, question_text,
-            question_image_url, explanation, points, time_limit_seconds
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-        """,
-        (subject_id, topic_id, question_type, question_text, None, explanation, points, time_limit_seconds),
+    batch_size: int = 1000,
+    on_conflict_skip: bool = False,
+) -> list:
+    """
+    Insert all questions with multi-row INSERTs of at most batch_size rows and
+    return their db ids in manifest order. Multi-row inserts sweet-spot around
+    1k-10k rows per statement; beyond that they regress.
+
+    With on_conflict_skip the manifest id is stored as external_id and rows
+    that already exist (same subject/topic/external_id; see
+    sql/add_questions_external_id_supabase.sql) are skipped, returning None in
+    their slot so reruns are idempotent.
+    """
+    rows = [
+        (
+            subject_id,
+            topic_id,
+            question_type,
+            q.get("question_text") or "Which shape is the odd one out?",
+            None,
+            q.get("explanation"),
+            points,
+            time_limit_seconds,
+        )
+        + ((q["id"],) if on_conflict_skip else ())
+        for q in questions
+    ]
+    columns = (
+        "subject_id, topic_id, question_type, question_text, "
+        "question_image_url, explanation, points, time_limit_seconds"
     )
-    row = cursor.fetchone()
-    question_db_id = row[0]
-
-    for order, filename in enumerate(option_files, start=1):
-        option_url = f"{question_base_url}/{filename}"
-        is_correct = order - 1 == correct_index
-        cursor.execute(
-            """
-            INSERT INTO answer_options (question_id, option_text, option_image_url, is_correct, display_order)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (question_db_id, "", option_url, is_correct, order),
+    if on_conflict_skip:
+        sql = (
+            "INSERT INTO questions (" + columns + ", external_id) VALUES {}"
+            # the WHERE predicate must match the partial unique index from
+            # sql/add_questions_external_id_supabase.sql or Postgres won't infer it
+            " ON CONFLICT (subject_id, topic_id, external_id) WHERE external_id IS NOT NULL DO NOTHING"
+            " RETURNING id, external_id"
         )
-    return question_db_id
+    else:
+        sql = "INSERT INTO questions (" + columns + ") VALUES {} RETURNING id"
+    row_template = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        from psycopg2.extras import execute_values
+
+        fetched = execute_values(cursor, sql.format("%s"), rows, page_size=batch_size, fetch=True)
+    else:
+        # psycopg3 / pg8000: compose the multi-row VALUES clause per chunk
+        fetched = []
+        if hasattr(cursor, "mogrify"):
+            step = batch_size
+        else:
+            # the extended protocol caps a statement at 65535 bind parameters,
+            # so the placeholder path clamps its chunks whatever --batch-size says
+            step = min(batch_size, 65535 // len(rows[0]))
+        for start in range(0, len(rows), step):
+            chunk = rows[start:start + step]
+            if hasattr(cursor, "mogrify"):
+                # psycopg3 ClientCursor (see run_inserts): bind the values
+                # client-side so the statement ships with zero protocol parameters
+                values = ",".join(cursor.mogrify(row_template, row) for row in chunk)
+                cursor.execute(sql.format(values))
+            else:
+                placeholders = ", ".join([row_template] * len(chunk))
+                cursor.execute(sql.format(placeholders), [v for row in chunk for v in row])
+            fetched.extend(cursor.fetchall())
+    if on_conflict_skip:
+        # Conflicting rows return nothing; align by external_id with None
+        # marking questions that were already in the table.
+        by_ext = {ext: db_id for db_id, ext in fetched}
+        return [by_ext.get(q["id"]) for q in questions]
+    return [r[0] for r in fetched]
+
+
+def _option_rows(questions: list[dict], question_db_ids: list[int], base_url: str) -> list[tuple]:
+    """Build (question_id, option_text, option_image_url, is_correct, display_order) rows for every option of every question."""
+    rows: list[tuple] = []
+    base_url = base_url.rstrip("/")
+    for q, db_id in zip(questions, question_db_ids):
+        if db_id is None:
+            continue  # question already present from an earlier run; its options are too
+        question_base_url = f"{base_url}/{q['id']}"
+        correct_index = q["correct_index"]
+        option_files = q.get("option_files", _STANDARD_OPTION_FILES)
+        for order, filename in enumerate(option_files, start=1):
+            rows.append((db_id, "", f"{question_base_url}/{filename}", order - 1 == correct_index, order))
+    return rows
+
+
+def _bulk_insert_options(cursor, option_rows: list[tuple], batch_size: int = 1000) -> None:
+    """Load all answer_options rows in chunks of batch_size. With psycopg2 each chunk streams CSV through COPY FROM STDIN (no RETURNING needed, so the rows are copy-eligible, and chunking keeps the staging buffer bounded); psycopg3 and pg8000 use multi-row INSERTs (COPY is not allowed inside psycopg3 pipeline mode)."""
+    if not option_rows:
+        return
+    if hasattr(cursor, "copy_expert"):
+        for start in range(0, len(option_rows), batch_size):
+            buf = io.StringIO()
+            # QUOTE_ALL so the empty option_text arrives as '' rather than NULL
+            writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+            writer.writerows(option_rows[start:start + batch_size])
+            buf.seek(0)
+            cursor.copy_expert(
+                "COPY answer_options (question_id, option_text, option_image_url, is_correct, display_order) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buf,
+            )
+        return
+    sql = (
+        "INSERT INTO answer_options ("
+        "question_id, option_text, option_image_url, is_correct, display_order"
+        ") VALUES "
+    )
+    # placeholder chunks also stay under the 65535-bind-parameter statement cap
+    step = batch_size if hasattr(cursor, "mogrify") else min(batch_size, 65535 // 5)
+    for start in range(0, len(option_rows), step):
+        chunk = option_rows[start:start + step]
+        if hasattr(cursor, "mogrify"):
+            # psycopg3 ClientCursor: see _bulk_insert_questions
+            cursor.execute(sql + ",".join(cursor.mogrify("(%s, %s, %s, %s, %s)", row) for row in chunk))
+        else:
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+            cursor.execute(sql + placeholders, [v for row in chunk for v in row])
 
 
 def _lookup_nvr_subject_topic(cursor) -> tuple[int, int]:
-    """Look up subject_id for code 'NVR' and topic_id for topic 'Shapes' (root) under that subject."""
-    cursor.execute("SELECT id FROM subjects WHERE code = 'NVR'")
-    row = cursor.fetchone()
-    if not row:
-        raise SystemExit("Subject with code 'NVR' not found. Run insert_nvr_subject_topic_supabase.sql first.")
-    subject_id = row[0]
+    """Look up subject_id for code 'NVR' and topic_id for topic 'Shapes' (root) under that subject, in one round trip."""
     cursor.execute(
-        "SELECT id FROM topics WHERE subject_id = %s AND name = 'Shapes' AND parent_topic_id IS NULL",
-        (subject_id,),
+        "SELECT s.id, t.id FROM subjects s"
+        " LEFT JOIN topics t ON t.subject_id = s.id AND t.name = 'Shapes' AND t.parent_topic_id IS NULL"
+        " WHERE s.code = 'NVR'"
     )
     row = cursor.fetchone()
     if not row:
+        raise SystemExit("Subject with code 'NVR' not found. Run insert_nvr_subject_topic_supabase.sql first.")
+    subject_id, topic_id = row
+    if topic_id is None:
         raise SystemExit("Topic 'Shapes' not found for subject NVR. Run insert_nvr_subject_topic_supabase.sql first.")
-    topic_id = row[0]
     return subject_id, topic_id
 
 
@@ -229,6 +491,11 @@ def main() -> None:
         default="options",
         help="Storage bucket name (for supabase upload). Default: options.",
     )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Before each PUT, HEAD the object and skip the upload if it already exists (cheap idempotent reruns).",
+    )
     parser.add_argument(
         "--prefix",
         type=str,
@@ -263,6 +530,18 @@ def main() -> None:
         metavar="DIR",
         help="Directory containing question subfolders (default: same dir as manifest).",
     )
+    parser.add_argument(
+        "--on-conflict-skip",
+        action="store_true",
+        help="Store the manifest id as questions.external_id and skip questions already inserted by an earlier run (requires sql/add_questions_external_id_supabase.sql).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="Rows per bulk INSERT/COPY statement. Default: 1000.",
+    )
     parser.add_argument(
         "--question-type",
         type=str,
@@ -281,6 +560,12 @@ def main() -> None:
         default=90,
         help="Time limit per question in seconds. Default: 90.",
     )
+    parser.add_argument(
+        "--upload-concurrency",
+        type=int,
+        default=16,
+        help="Parallel upload workers for --upload supabase. Default: 16.",
+    )
     args = parser.parse_args()
 
     manifest_path = args.manifest.resolve()
@@ -300,16 +585,17 @@ def main() -> None:
         print("Dry run: no upload, no DB insert.")
         print(f"Manifest: {manifest_path} ({len(questions)} questions)")
         print(f"Questions dir: {questions_dir}")
-        for q in questions:
-            qid = q["id"]
-            qdir = questions_dir / qid
-            exists = qdir.is_dir()
-            print(f"  {qid}: dir exists={exists}, correct_index={q.get('correct_index')}")
+        # stat the folders concurrently (serial is fine on local disk but
+        # pays one RTT each on networked storage), then print in order
+        with ThreadPoolExecutor(max_workers=min(32, len(questions))) as pool:
+            exist = pool.map(lambda q: (questions_dir / q["id"]).is_dir(), questions)
+            for q, exists in zip(questions, exist):
+                print(f"  {q['id']}: dir exists={exists}, correct_index={q.get('correct_index')}")
         return
 
     if not args.base_url:
         raise SystemExit("Without --dry-run, provide --base-url (or upload and we build it from storage).")
-    base_url = args.base_url
+    base_url = args.base_url.rstrip("/")
 
     subject_id = args.subject_id if args.subject_id is not None else os.environ.get("SUBJECT_ID")
     topic_id = args.topic_id if args.topic_id is not None else os.environ.get("TOPIC_ID")
@@ -318,73 +604,151 @@ def main() -> None:
     if topic_id is not None:
         topic_id = int(topic_id)
 
-    # Upload if requested
-    if args.upload == "supabase":
+    def run_uploads() -> None:
         if not base_url:
             raise SystemExit("With --upload supabase you must set --base-url to the bucket public URL.")
         for q in questions:
-            qid = q["id"]
-            qdir = questions_dir / qid
+            qdir = questions_dir / q["id"]
             if not qdir.is_dir():
                 raise SystemExit(f"Question folder not found: {qdir}")
-            print(f"Uploading {qid} … ", end="", flush=True)
-            _upload_supabase(qdir, qid, args.bucket, args.prefix, base_url)
-            print("ok")
+        # Uploads are network-bound (one PUT per file, each waiting on RTT),
+        # so run the per-question folders through a thread pool.
+        print_lock = threading.Lock()
+        progress = tqdm(total=len(questions), desc="upload", unit="q") if tqdm is not None else None
 
-    # DB insert
-    if not args.database_url:
-        print("No DATABASE_URL / --database-url; skipping insert.")
-        return
-
-    conn = None
-    try:
-        import psycopg2
-        conn = psycopg2.connect(args.database_url)
-    except ImportError:
+        def upload_one(q: dict) -> None:
+            qid = q["id"]
+            # The manifest already lists each question's files; trusting it
+            # skips a readdir+stat per question and fixes the upload order.
+            files = [questions_dir / qid / fn for fn in q.get("option_files", _STANDARD_OPTION_FILES)]
+            _upload_supabase(files, qid, args.bucket, args.prefix, base_url, skip_existing=args.skip_existing)
+            if progress is not None:
+                progress.update(1)
+            else:
+                with print_lock:
+                    print(f"Uploaded {qid}")
+
+        workers = max(1, min(args.upload_concurrency, len(questions)))
         try:
-            import pg8000
-            from urllib.parse import urlparse
-            u = urlparse(args.database_url)
-            if u.scheme not in ("postgresql", "postgres"):
-                raise SystemExit("DATABASE_URL must be postgresql://...")
-            conn = pg8000.connect(
-                host=u.hostname or "127.0.0.1",
-                port=int(u.port or 5432),
-                user=u.username or "postgres",
-                password=u.password or "",
-                database=(u.path or "/postgres").lstrip("/") or "postgres",
-            )
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() drains the iterator so the first failure propagates
+                list(pool.map(upload_one, questions))
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def run_inserts():
+        """Connect and run the bulk inserts; returns the open connection with the transaction still uncommitted."""
+        nonlocal subject_id, topic_id
+        conn = None
+        try:
+            import psycopg  # v3: enables libpq pipeline mode below
+            # ClientCursor binds values client-side, which is what lets the
+            # bulk helpers compose parameter-free multi-row INSERTs
+            conn = psycopg.connect(args.database_url, cursor_factory=psycopg.ClientCursor)
         except ImportError:
-            raise SystemExit(
-                "DB insert requires a PostgreSQL driver. Install one:\n"
-                "  pip install psycopg2-binary   (or)\n"
-                "  pip install pg8000"
-            )
-
-    conn.autocommit = False
-    try:
-        with conn.cursor() as cur:
-            if subject_id is None or topic_id is None:
-                subject_id, topic_id = _lookup_nvr_subject_topic(cur)
-                print(f"Using subject_id={subject_id} (NVR), topic_id={topic_id} (Shapes)")
-            for q in questions:
-                qid = q["id"]
-                q_db_id = _insert_question_and_options(
+            try:
+                import psycopg2
+                conn = psycopg2.connect(args.database_url)
+            except ImportError:
+                try:
+                    import pg8000
+                    from urllib.parse import urlparse
+                    u = urlparse(args.database_url)
+                    if u.scheme not in ("postgresql", "postgres"):
+                        raise SystemExit("DATABASE_URL must be postgresql://...")
+                    conn = pg8000.connect(
+                        host=u.hostname or "127.0.0.1",
+                        port=int(u.port or 5432),
+                        user=u.username or "postgres",
+                        password=u.password or "",
+                        database=(u.path or "/postgres").lstrip("/") or "postgres",
+                    )
+                except ImportError:
+                    raise SystemExit(
+                        "DB insert requires a PostgreSQL driver. Install one:\n"
+                        "  pip install psycopg[binary]   (or)\n"
+                        "  pip install psycopg2-binary   (or)\n"
+                        "  pip install pg8000"
+                    )
+
+        conn.autocommit = False
+        try:
+            # psycopg3 pipeline mode sends the statements back-to-back with one
+            # final Sync (needs libpq >= 14); other drivers run them as before.
+            pipeline = conn.pipeline() if hasattr(conn, "pipeline") else contextlib.nullcontext()
+            with pipeline, conn.cursor() as cur:
+                if subject_id is None or topic_id is None:
+                    subject_id, topic_id = _lookup_nvr_subject_topic(cur)
+                    print(f"Using subject_id={subject_id} (NVR), topic_id={topic_id} (Shapes)")
+                question_db_ids = _bulk_insert_questions(
                     cur,
-                    q,
-                    base_url,
+                    questions,
                     subject_id,
                     topic_id,
                     question_type=args.question_type,
                     points=args.points,
                     time_limit_seconds=args.time_limit_seconds,
+                    batch_size=args.batch_size,
+                    on_conflict_skip=args.on_conflict_skip,
                 )
-                print(f"Inserted {qid} -> questions.id={q_db_id}")
+                _bulk_insert_options(cur, _option_rows(questions, question_db_ids, base_url), batch_size=args.batch_size)
+                inserted = [i for i in question_db_ids if i is not None]
+                skipped = len(question_db_ids) - len(inserted)
+                if tqdm is not None or not inserted:
+                    print(f"Inserted {len(inserted)} questions" + (f", skipped {skipped} already present." if skipped else "."))
+                else:
+                    for q, q_db_id in zip(questions, question_db_ids):
+                        if q_db_id is None:
+                            print(f"Skipped {q['id']} (already inserted)")
+                        else:
+                            print(f"Inserted {q['id']} -> questions.id={q_db_id}")
+        except BaseException:
+            conn.rollback()
+            conn.close()
+            raise
+        return conn
+
+    do_upload = args.upload == "supabase"
+
+    if not args.database_url:
+        if do_upload:
+            run_uploads()
+        print("No DATABASE_URL / --database-url; skipping insert.")
+        return
+
+    # The inserts only need the URL template, not the uploaded bytes, so
+    # overlap them with the upload phase and commit only once every upload
+    # has succeeded (a failed upload still rolls the transaction back).
+    conn = None
+    try:
+        if do_upload:
+            with ThreadPoolExecutor(max_workers=1) as db_pool:
+                insert_future = db_pool.submit(run_inserts)
+                try:
+                    run_uploads()
+                except BaseException:
+                    # don't leave the insert transaction hanging open
+                    try:
+                        c = insert_future.result()
+                    except BaseException:
+                        pass
+                    else:
+                        c.rollback()
+                        c.close()
+                    raise
+            conn = insert_future.result()
+        else:
+            conn = run_inserts()
         conn.commit()
     except Exception as e:
-        conn.rollback()
+        if conn is not None:
+            conn.rollback()
+            conn.close()
+        if isinstance(e, SystemExit):
+            raise
         raise SystemExit(f"Insert failed: {e}") from e
-    finally:
+    else:
         conn.close()
     print("Done.")
 
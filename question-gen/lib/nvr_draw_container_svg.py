@@ -23,6 +23,9 @@ Usage:
 """
 
 import argparse
+import array
+import bisect
+import functools
 import math
 import random
 import re
@@ -62,18 +65,28 @@ SHAPES_SYMBOLS = ["plus", "times", "club", "heart", "diamond", "spade", "star"]
 SHAPES_ALL = SHAPES_REGULAR + SHAPES_IRREGULAR + SHAPES_SYMBOLS
 
 
+# Precompiled patterns for motif/symbol SVG parsing (hot in batch runs).
+# _MOTIF_SVG_RE is anchored so non-SVG input fails fast instead of scanning.
+_MOTIF_SVG_RE = re.compile(r"\A\s*(?:<\?[^>]*\?>\s*)?(?:<!--.*?-->\s*)*<svg([^>]*)>(.*)</svg>", re.DOTALL)
+_MOTIF_VIEWBOX_RE = re.compile(r'viewBox\s*=\s*["\']?\s*0\s+0\s+([\d.]+)\s+([\d.]+)')
+_ROTATE_TRANSFORM_RE = re.compile(r"rotate\s*\(\s*([-\d.]+)\s*[, ]\s*([-\d.]+)\s*[, ]\s*([-\d.]+)\s*\)", re.IGNORECASE)
+_MOTIF_FILL_NONE_RE = re.compile(r'\bfill="none"', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
 def load_motif_content(motif_path: Path) -> tuple[str, float, float, float]:
     """Load motif SVG (e.g. shape-club.svg); return (inner content, scale, translate_x, translate_y).
     Scale/translate place the motif in a MOTIF_CELL_SIZE×MOTIF_CELL_SIZE cell in 0 0 100 100 space.
     Motifs are always rendered filled black in layouts (guide §3.2).
+    Cached: batch drivers load the same motif once per process instead of per option.
     """
     text = motif_path.read_text(encoding="utf-8")
-    match = re.search(r"<svg([^>]*)>(.*)</svg>", text, re.DOTALL)
+    match = _MOTIF_SVG_RE.search(text)
     if not match:
         raise SystemExit(f"Could not parse motif SVG: {motif_path}")
     attrs, inner = match.group(1), match.group(2).strip()
     # Parse viewBox: "0 0 W H" -> scale so motif fits in MOTIF_CELL_SIZE, centre at (W/2, H/2)
-    vb = re.search(r'viewBox\s*=\s*["\']?\s*0\s+0\s+([\d.]+)\s+([\d.]+)', attrs)
+    vb = _MOTIF_VIEWBOX_RE.search(attrs)
     if vb:
         w, h = float(vb.group(1)), float(vb.group(2))
         size = max(w, h, 1.0)
@@ -85,43 +98,55 @@ def load_motif_content(motif_path: Path) -> tuple[str, float, float, float]:
     return inner, scale, tx, ty
 
 
+_SQRT2 = math.sqrt(2)
+
+# Per-symmetry operations resolved once per placement run instead of re-branching
+# on the symmetry string for every candidate. Each entry is
+# (mirror, in_canonical_half, distance_from_line) for viewBox 0 0 100 100.
+# symmetry: vertical (|), horizontal (-), diagonal_slash (/), diagonal_backslash (\).
+_SYMMETRY_OPS: dict[str, tuple[Callable, Callable, Callable]] = {
+    "vertical": (
+        lambda x, y: (100.0 - x, y),
+        lambda x, y: x <= 50.0,
+        lambda x, y: abs(x - 50.0),
+    ),
+    "horizontal": (
+        lambda x, y: (x, 100.0 - y),
+        lambda x, y: y <= 50.0,
+        lambda x, y: abs(y - 50.0),
+    ),
+    "diagonal_slash": (
+        lambda x, y: (y, x),
+        lambda x, y: x <= y,
+        lambda x, y: abs(x - y) / _SQRT2,
+    ),
+    "diagonal_backslash": (
+        lambda x, y: (100.0 - y, 100.0 - x),
+        lambda x, y: x + y <= 100.0,
+        lambda x, y: abs(x + y - 100.0) / _SQRT2,
+    ),
+}
+
+_SYMMETRY_OPS_DEFAULT: tuple[Callable, Callable, Callable] = (
+    lambda x, y: (x, y),
+    lambda x, y: True,
+    lambda x, y: 0.0,
+)
+
+
 def _mirror_point(x: float, y: float, symmetry: str) -> tuple[float, float]:
-    """Reflect (x, y) about the line of symmetry in viewBox 0 0 100 100. symmetry: vertical (|), horizontal (-), diagonal_slash (/), diagonal_backslash (\\)."""
-    if symmetry == "vertical":
-        return (100.0 - x, y)
-    if symmetry == "horizontal":
-        return (x, 100.0 - y)
-    if symmetry == "diagonal_slash":
-        return (y, x)
-    if symmetry == "diagonal_backslash":
-        return (100.0 - y, 100.0 - x)
-    return (x, y)
+    """Reflect (x, y) about the line of symmetry in viewBox 0 0 100 100."""
+    return _SYMMETRY_OPS.get(symmetry, _SYMMETRY_OPS_DEFAULT)[0](x, y)
 
 
 def _distance_from_symmetry_line(x: float, y: float, symmetry: str) -> float:
     """Perpendicular distance from (x, y) to the symmetry line in viewBox 0 0 100 100."""
-    if symmetry == "vertical":
-        return abs(x - 50.0)
-    if symmetry == "horizontal":
-        return abs(y - 50.0)
-    if symmetry == "diagonal_slash":
-        return abs(x - y) / math.sqrt(2)
-    if symmetry == "diagonal_backslash":
-        return abs(x + y - 100.0) / math.sqrt(2)
-    return 0.0
+    return _SYMMETRY_OPS.get(symmetry, _SYMMETRY_OPS_DEFAULT)[2](x, y)
 
 
 def _in_canonical_half(x: float, y: float, symmetry: str) -> bool:
     """True if (x, y) is in the canonical half (or on the line) for placing; mirror half is generated automatically."""
-    if symmetry == "vertical":
-        return x <= 50.0
-    if symmetry == "horizontal":
-        return y <= 50.0
-    if symmetry == "diagonal_slash":
-        return x <= y
-    if symmetry == "diagonal_backslash":
-        return x + y <= 100.0
-    return True
+    return _SYMMETRY_OPS.get(symmetry, _SYMMETRY_OPS_DEFAULT)[1](x, y)
 
 
 def _sample_on_symmetry_line(
@@ -130,31 +155,138 @@ def _sample_on_symmetry_line(
     inside_check: Callable[[float, float], bool],
     bounds: tuple[float, float, float, float],
     min_dist: float,
-    existing: list[tuple[float, float]],
+    grid: "_NeighbourGrid",
 ) -> tuple[float, float] | None:
-    """Return one point on the mirror line that is inside and not overlapping existing, or None."""
-    def distance(a: tuple[float, float], b: tuple[float, float]) -> float:
-        return math.hypot(a[0] - b[0], a[1] - b[1])
-
+    """Return one point on the mirror line that is inside and not overlapping existing (tracked by grid), or None."""
     min_x, max_x, min_y, max_y = bounds[0], bounds[1], bounds[2], bounds[3]
+    # Resolve the sampling interval once; inside the loop only draw rng.random()
+    # and scale (bit-identical to rng.uniform(lo, hi)).
+    if symmetry == "vertical":
+        lo, hi = min_y, max_y
+    elif symmetry == "horizontal":
+        lo, hi = min_x, max_x
+    elif symmetry == "diagonal_slash":
+        lo, hi = max(min_x, min_y), min(max_x, max_y)
+    else:
+        lo, hi = max(min_x, 100 - max_y), min(max_x, 100 - min_y)
+    width = hi - lo
+    rand = rng.random
     for _ in range(MAX_PLACEMENT_ATTEMPTS):
+        t = lo + width * rand()
         if symmetry == "vertical":
-            x, y = 50.0, rng.uniform(min_y, max_y)
+            x, y = 50.0, t
         elif symmetry == "horizontal":
-            x, y = rng.uniform(min_x, max_x), 50.0
+            x, y = t, 50.0
         elif symmetry == "diagonal_slash":
-            t = rng.uniform(max(min_x, min_y), min(max_x, max_y))
             x, y = t, t
         else:
-            t = rng.uniform(max(min_x, 100 - max_y), min(max_x, 100 - min_y))
             x, y = t, 100.0 - t
         if not inside_check(x, y):
             continue
-        if all(distance((x, y), p) >= min_dist for p in existing):
+        if not grid.too_close(x, y):
             return (x, y)
     return None
 
 
+# 5x5 neighbourhood minus the four corner cells: with cell size min_dist/sqrt(2)
+# a point two cells away both horizontally and vertically is at least min_dist
+# from anywhere in the candidate's cell, so the corners can never reject.
+_GRID_NEIGHBOURHOOD = tuple(
+    (dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if abs(dx) != 2 or abs(dy) != 2
+)
+
+
+class _NeighbourGrid:
+    """Background grid for min-distance checks. With cell size min_dist/sqrt(2) each cell holds at most one accepted point, so a candidate only tests the surrounding neighbourhood instead of every accepted point."""
+
+    def __init__(self, min_dist: float) -> None:
+        self.cell = min_dist / math.sqrt(2)
+        self.min_dist_sq = min_dist * min_dist
+        self.cells: dict[tuple[int, int], tuple[float, float]] = {}
+
+    def key(self, x: float, y: float) -> tuple[int, int]:
+        return (int(x // self.cell), int(y // self.cell))
+
+    def add(self, x: float, y: float) -> None:
+        self.cells[self.key(x, y)] = (x, y)
+
+    def too_close(self, x: float, y: float) -> bool:
+        """True if any accepted point is closer than min_dist to (x, y)."""
+        gx, gy = self.key(x, y)
+        cells_get = self.cells.get
+        min_dist_sq = self.min_dist_sq
+        for ox, oy in _GRID_NEIGHBOURHOOD:
+            p = cells_get((gx + ox, gy + oy))
+            if p is not None:
+                dx = p[0] - x
+                dy = p[1] - y
+                if dx * dx + dy * dy < min_dist_sq:
+                    return True
+        return False
+
+
+# Poisson-disk (Bridson) sampling kicks in for dense layouts, where plain
+# rejection sampling burns most of its attempt budget near area capacity.
+_POISSON_THRESHOLD = 12   # use Bridson at or above this count
+_POISSON_K = 30           # candidates tried around each active sample
+
+
+def _poisson_disk_positions(
+    count: int,
+    min_dist: float,
+    rng: random.Random,
+    inside_check: Callable[[float, float], bool] | None,
+    bounds: tuple[float, float, float, float],
+    sample_point: Callable[[random.Random], tuple[float, float]] | None,
+    max_seed_attempts: int,
+) -> list[tuple[float, float]]:
+    """Bridson Poisson-disk sampling: O(count) placement with guaranteed min_dist. Candidates around each accepted sample are drawn from the annulus [min_dist, 2*min_dist]; a _NeighbourGrid limits distance checks to a constant number of cells."""
+    min_x, max_x, min_y, max_y = bounds
+    grid = _NeighbourGrid(min_dist)
+
+    def add(x: float, y: float) -> None:
+        positions.append((x, y))
+        active.append((x, y))
+        grid.add(x, y)
+
+    positions: list[tuple[float, float]] = []
+    active: list[tuple[float, float]] = []
+    rand = rng.random
+    cos, sin, two_pi = math.cos, math.sin, 2.0 * math.pi
+    too_close = grid.too_close
+    seed_attempts = 0
+    while len(positions) < count:
+        if not active:
+            # (Re)seed from a fresh uniform sample; bounded by the attempt budget
+            if seed_attempts >= max_seed_attempts:
+                break
+            seed_attempts += 1
+            if sample_point is not None:
+                x, y = sample_point(rng)
+            else:
+                x, y = rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)
+            if (inside_check is None or inside_check(x, y)) and not grid.too_close(x, y):
+                add(x, y)
+            continue
+        i = rng.randrange(len(active))
+        ax, ay = active[i]
+        for _ in range(_POISSON_K):
+            r = min_dist * (1.0 + rand())
+            theta = rand() * two_pi
+            x = ax + r * cos(theta)
+            y = ay + r * sin(theta)
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            if inside_check is not None and not inside_check(x, y):
+                continue
+            if not too_close(x, y):
+                add(x, y)
+                break
+        else:
+            active.pop(i)
+    return positions
+
+
 def random_positions(
     count: int,
     min_dist: float = MIN_DISTANCE,
@@ -163,39 +295,141 @@ def random_positions(
     bounds: tuple[float, float, float, float] | None = None,
     sample_point: Callable[[random.Random], tuple[float, float]] | None = None,
     max_attempts: int | None = None,
+    rng: random.Random | None = None,
 ) -> list[tuple[float, float]]:
-    """Generate `count` positions with no two closer than `min_dist`. Optional inside_check, bounds, or sample_point(rng) (e.g. cross-only)."""
+    """Generate `count` positions with no two closer than `min_dist`. Optional inside_check, bounds, or sample_point(rng) (e.g. cross-only). Pass rng to reuse one RNG across calls (batch drivers); otherwise a fresh one is seeded from `seed`."""
     limit = max_attempts if max_attempts is not None else MAX_PLACEMENT_ATTEMPTS
-    rng = random.Random(seed)
-    positions: list[tuple[float, float]] = []
+    if rng is None:
+        rng = random.Random(seed)
     min_x, max_x = (bounds[0], bounds[1]) if bounds else (MIN_CENTRE, MAX_CENTRE)
     min_y, max_y = (bounds[2], bounds[3]) if bounds else (MIN_CENTRE, MAX_CENTRE)
 
-    def distance(a: tuple[float, float], b: tuple[float, float]) -> float:
-        return math.hypot(a[0] - b[0], a[1] - b[1])
-
-    def accept(cx: float, cy: float) -> bool:
-        if inside_check is not None and not inside_check(cx, cy):
-            return False
-        return all(distance((cx, cy), p) >= min_dist for p in positions)
-
-    def next_point() -> tuple[float, float]:
-        if sample_point is not None:
-            return sample_point(rng)
-        return (rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
-
+    if count >= _POISSON_THRESHOLD:
+        positions = _poisson_disk_positions(
+            count, min_dist, rng, inside_check, (min_x, max_x, min_y, max_y), sample_point, limit
+        )
+        if len(positions) < count:
+            raise SystemExit(
+                f"Could not place {count} motifs with min distance {min_dist} in {limit} attempts."
+            )
+        return positions[:count]
+
+    # SoA storage: parallel coordinate arrays avoid a tuple allocation per point
+    xs, ys = array.array("d"), array.array("d")
+    grid = _NeighbourGrid(min_dist)
+    # Local bindings and precomputed spans: rng.uniform(a, b) is
+    # a + (b - a) * rng.random() in CPython, so this is bit-identical
+    # while skipping a method call and two subtractions per candidate.
+    rand = rng.random
+    width_x = max_x - min_x
+    width_y = max_y - min_y
+    too_close, grid_add = grid.too_close, grid.add
+    xs_append, ys_append = xs.append, ys.append
     attempts = 0
-    while len(positions) < count and attempts < limit:
-        cx, cy = next_point()
-        if accept(cx, cy):
-            positions.append((cx, cy))
+    placed = 0
+    while placed < count and attempts < limit:
         attempts += 1
+        if sample_point is not None:
+            cx, cy = sample_point(rng)
+        else:
+            cx = min_x + width_x * rand()
+            cy = min_y + width_y * rand()
+        if inside_check is not None and not inside_check(cx, cy):
+            continue
+        if too_close(cx, cy):
+            continue
+        xs_append(cx)
+        ys_append(cy)
+        grid_add(cx, cy)
+        placed += 1
 
-    if len(positions) < count:
+    if placed < count:
         raise SystemExit(
             f"Could not place {count} motifs with min distance {min_dist} in {limit} attempts."
         )
-    return positions
+    return list(zip(xs, ys))
+
+
+def _make_accept_pair(
+    symmetry: str,
+    inside_check: Callable[[float, float], bool],
+    grid: _NeighbourGrid,
+    min_dist_from_line: float,
+) -> Callable[[float, float], bool]:
+    """Build the accept test for symmetric pair placement, specialized per symmetry so the mirror and line-distance arithmetic are inlined — no dispatch or helper calls inside the hot loop."""
+    too_close = grid.too_close
+
+    if symmetry == "vertical":
+        def accept_pair(cx: float, cy: float) -> bool:
+            if cx > 50.0:
+                return False
+            if not inside_check(cx, cy):
+                return False
+            if cx == 50.0:
+                # On the line: allowed (symmetric motif); check overlap with existing only
+                return not too_close(cx, cy)
+            # Off the line: must be at least min_dist/2 from line so mirror does not overlap
+            if 50.0 - cx < min_dist_from_line:
+                return False
+            # Mirror side only checked once the cheap rejections have passed
+            mx = 100.0 - cx
+            if not inside_check(mx, cy):
+                return False
+            return not too_close(cx, cy) and not too_close(mx, cy)
+        return accept_pair
+
+    if symmetry == "horizontal":
+        def accept_pair(cx: float, cy: float) -> bool:
+            if cy > 50.0:
+                return False
+            if not inside_check(cx, cy):
+                return False
+            if cy == 50.0:
+                return not too_close(cx, cy)
+            if 50.0 - cy < min_dist_from_line:
+                return False
+            my = 100.0 - cy
+            if not inside_check(cx, my):
+                return False
+            return not too_close(cx, cy) and not too_close(cx, my)
+        return accept_pair
+
+    if symmetry == "diagonal_slash":
+        def accept_pair(cx: float, cy: float) -> bool:
+            if cx > cy:
+                return False
+            if not inside_check(cx, cy):
+                return False
+            if cx == cy:
+                return not too_close(cx, cy)
+            if (cy - cx) / _SQRT2 < min_dist_from_line:
+                return False
+            if not inside_check(cy, cx):
+                return False
+            return not too_close(cx, cy) and not too_close(cy, cx)
+        return accept_pair
+
+    if symmetry == "diagonal_backslash":
+        def accept_pair(cx: float, cy: float) -> bool:
+            if cx + cy > 100.0:
+                return False
+            if not inside_check(cx, cy):
+                return False
+            mx = 100.0 - cy
+            my = 100.0 - cx
+            if mx == cx and my == cy:
+                return not too_close(cx, cy)
+            if abs(cx + cy - 100.0) / _SQRT2 < min_dist_from_line:
+                return False
+            if not inside_check(mx, my):
+                return False
+            return not too_close(cx, cy) and not too_close(mx, my)
+        return accept_pair
+
+    # Unknown symmetry mirrors to itself: every point is on the line.
+    def accept_pair(cx: float, cy: float) -> bool:
+        return inside_check(cx, cy) and not too_close(cx, cy)
+    return accept_pair
 
 
 def _canonical_half_bounds_for_pairs(
@@ -221,61 +455,72 @@ def random_positions_symmetric(
     seed: int | None,
     inside_check: Callable[[float, float], bool],
     bounds: tuple[float, float, float, float],
+    rng: random.Random | None = None,
 ) -> list[tuple[float, float]]:
-    """Generate `count` positions so the layout is symmetric about the given line (guide §3.9)."""
-    rng = random.Random(seed)
-    positions: list[tuple[float, float]] = []
+    """Generate `count` positions so the layout is symmetric about the given line (guide §3.9). Pass rng to reuse one RNG across calls; otherwise a fresh one is seeded from `seed`."""
+    if rng is None:
+        rng = random.Random(seed)
+    # SoA storage: parallel coordinate arrays avoid a tuple allocation per point
+    xs, ys = array.array("d"), array.array("d")
     min_x, max_x, min_y, max_y = bounds[0], bounds[1], bounds[2], bounds[3]
-
-    def distance(a: tuple[float, float], b: tuple[float, float]) -> float:
-        return math.hypot(a[0] - b[0], a[1] - b[1])
+    grid = _NeighbourGrid(min_dist)
 
     # Off the line, a pair (point + mirror) must be at least min_dist apart, so point must be >= min_dist/2 from the line (guide: spacing with symmetry).
     min_dist_from_line = min_dist / 2.0
     # Sample pairs only in the canonical half inset from the line so we don't waste attempts
     pair_min_x, pair_max_x, pair_min_y, pair_max_y = _canonical_half_bounds_for_pairs(bounds, symmetry, min_dist_from_line)
-
-    def accept_pair(cx: float, cy: float) -> bool:
-        if not _in_canonical_half(cx, cy, symmetry):
-            return False
-        if not inside_check(cx, cy):
-            return False
-        mx, my = _mirror_point(cx, cy, symmetry)
-        if not inside_check(mx, my):
-            return False
-        if (cx, cy) == (mx, my):
-            # On the line: allowed (symmetric motif); check overlap with existing only
-            return all(distance((cx, cy), p) >= min_dist for p in positions)
-        # Off the line: must be at least min_dist/2 from line so mirror does not overlap
-        if _distance_from_symmetry_line(cx, cy, symmetry) < min_dist_from_line:
-            return False
-        for p in positions:
-            if distance((cx, cy), p) < min_dist or distance((mx, my), p) < min_dist:
-                return False
-        return True
+    # Mirror op resolved once for appending accepted pairs; the accept test
+    # itself is specialized per symmetry with the arithmetic inlined.
+    mirror = _SYMMETRY_OPS.get(symmetry, _SYMMETRY_OPS_DEFAULT)[0]
+    accept_pair = _make_accept_pair(symmetry, inside_check, grid, min_dist_from_line)
 
     need_pairs = count // 2
     need_on_line = count % 2
     max_attempts = MAX_PLACEMENT_ATTEMPTS_SYMMETRIC
     attempts = 0
-    while len(positions) < count and attempts < max_attempts:
-        if len(positions) < 2 * need_pairs:
-            cx = rng.uniform(pair_min_x, pair_max_x)
-            cy = rng.uniform(pair_min_y, pair_max_y)
+    # Same bit-identical uniform() expansion as in random_positions
+    rand = rng.random
+    pair_width_x = pair_max_x - pair_min_x
+    pair_width_y = pair_max_y - pair_min_y
+    while len(xs) < count and attempts < max_attempts:
+        if len(xs) < 2 * need_pairs:
+            cx = pair_min_x + pair_width_x * rand()
+            cy = pair_min_y + pair_width_y * rand()
             if accept_pair(cx, cy):
-                positions.append((cx, cy))
-                positions.append(_mirror_point(cx, cy, symmetry))
-        elif need_on_line and len(positions) == count - 1:
-            on_line = _sample_on_symmetry_line(rng, symmetry, inside_check, bounds, min_dist, positions)
+                mx, my = mirror(cx, cy)
+                xs.append(cx)
+                ys.append(cy)
+                xs.append(mx)
+                ys.append(my)
+                grid.add(cx, cy)
+                grid.add(mx, my)
+        elif need_on_line and len(xs) == count - 1:
+            on_line = _sample_on_symmetry_line(rng, symmetry, inside_check, bounds, min_dist, grid)
             if on_line is not None:
-                positions.append(on_line)
+                xs.append(on_line[0])
+                ys.append(on_line[1])
+                grid.add(*on_line)
         attempts += 1
 
-    if len(positions) < count:
+    if len(xs) < count:
         raise SystemExit(
             f"Could not place {count} motifs with layout-symmetry {symmetry} in {max_attempts} attempts."
         )
-    return positions
+    return list(zip(xs, ys))
+
+
+@functools.lru_cache(maxsize=32)
+def _regular_polygon_vertices_cached(
+    sides: int, cx: float, cy: float, radius: float, phase: float
+) -> tuple[tuple[float, float], ...]:
+    """Computed vertex table per (sides, cx, cy, radius, phase); the same few polygons recur across a batch run."""
+    if sides < 3:
+        sides = 3
+    points: list[tuple[float, float]] = []
+    for k in range(sides):
+        angle = -math.pi / 2 + phase + k * 2 * math.pi / sides
+        points.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
+    return tuple(points)
 
 
 def regular_polygon_vertices(
@@ -286,15 +531,7 @@ def regular_polygon_vertices(
     phase: float = 0,
 ) -> list[tuple[float, float]]:
     """Vertices of regular polygon, counterclockwise. phase=0 gives a vertex at top; phase=pi/(2*n) gives flat bottom (hexagon, octagon)."""
-    if sides < 3:
-        sides = 3
-    points: list[tuple[float, float]] = []
-    for k in range(sides):
-        angle = -math.pi / 2 + phase + k * 2 * math.pi / sides
-        x = cx + radius * math.cos(angle)
-        y = cy + radius * math.sin(angle)
-        points.append((x, y))
-    return points
+    return list(_regular_polygon_vertices_cached(sides, cx, cy, radius, phase))
 
 
 def regular_polygon_path(
@@ -305,8 +542,11 @@ def regular_polygon_path(
     phase: float = 0,
 ) -> str:
     """SVG path for regular polygon."""
-    points = regular_polygon_vertices(sides, cx, cy, radius, phase)
-    return "M " + " L ".join(f"{x:.2f} {y:.2f}" for x, y in points) + " Z"
+    points = _regular_polygon_vertices_cached(sides, cx, cy, radius, phase)
+    buf = [f"M {points[0][0]:.2f} {points[0][1]:.2f}"]
+    buf.extend(f"L {x:.2f} {y:.2f}" for x, y in points[1:])
+    buf.append("Z")
+    return " ".join(buf)
 
 
 # Phase so hexagon and octagon have a horizontal edge at the bottom (not a point)
@@ -319,28 +559,23 @@ POLYGON_PHASE: dict[str, float] = {
 def point_in_convex_polygon(p: tuple[float, float], vertices: list[tuple[float, float]]) -> bool:
     """True if p is inside the convex polygon (vertices counterclockwise)."""
     px, py = p
-    n = len(vertices)
-    for i in range(n):
-        ax, ay = vertices[i]
-        bx, by = vertices[(i + 1) % n]
-        cross = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
-        if cross < 0:
+    ax, ay = vertices[-1]
+    for bx, by in vertices:
+        if (bx - ax) * (py - ay) - (by - ay) * (px - ax) < 0:
             return False
+        ax, ay = bx, by
     return True
 
 
 def point_in_polygon_ray(p: tuple[float, float], vertices: list[tuple[float, float]]) -> bool:
     """True if p is inside the polygon (any); ray-casting from p to the right."""
     px, py = p
-    n = len(vertices)
     inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = vertices[i]
-        xj, yj = vertices[j]
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
         if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
             inside = not inside
-        j = i
+        xj, yj = xi, yi
     return inside
 
 
@@ -353,17 +588,188 @@ def distance_point_to_segment(p: tuple[float, float], a: tuple[float, float], b:
     wx, wy = px - ax, py - ay
     d2 = vx * vx + vy * vy
     if d2 <= 0:
-        return math.hypot(wx, wy)
+        return math.sqrt(wx * wx + wy * wy)
     t = max(0.0, min(1.0, (wx * vx + wy * vy) / d2))
-    qx = ax + t * vx
-    qy = ay + t * vy
-    return math.hypot(px - qx, py - qy)
+    qx = px - (ax + t * vx)
+    qy = py - (ay + t * vy)
+    return math.sqrt(qx * qx + qy * qy)
 
 
 def min_distance_to_edges(p: tuple[float, float], vertices: list[tuple[float, float]]) -> float:
     """Minimum distance from point p to any edge of the polygon."""
-    n = len(vertices)
-    return min(distance_point_to_segment(p, vertices[i], vertices[(i + 1) % n]) for i in range(n))
+    px, py = p
+    best = math.inf
+    ax, ay = vertices[-1]
+    for bx, by in vertices:
+        # Inlined distance_point_to_segment: this runs per candidate per edge
+        vx, vy = bx - ax, by - ay
+        wx, wy = px - ax, py - ay
+        d2 = vx * vx + vy * vy
+        if d2 <= 0:
+            d = math.sqrt(wx * wx + wy * wy)
+        else:
+            t = max(0.0, min(1.0, (wx * vx + wy * vy) / d2))
+            qx = px - (ax + t * vx)
+            qy = py - (ay + t * vy)
+            d = math.sqrt(qx * qx + qy * qy)
+        if d < best:
+            best = d
+        ax, ay = bx, by
+    return best
+
+
+@functools.lru_cache(maxsize=64)
+def _prepare_polygon_edges(vertices: tuple[tuple[float, float], ...]) -> tuple[tuple[float, float, float, float, float], ...]:
+    """Per-edge (ax, ay, vx, vy, d2) precomputed once per polygon: edge origin, edge vector and squared edge length. The placement loops test thousands of points against the same polygon, so the subtractions are hoisted out of the inner loop."""
+    edges: list[tuple[float, float, float, float, float]] = []
+    ax, ay = vertices[-1]
+    for bx, by in vertices:
+        vx, vy = bx - ax, by - ay
+        edges.append((ax, ay, vx, vy, vx * vx + vy * vy))
+        ax, ay = bx, by
+    return tuple(edges)
+
+
+def _min_edge_distance(px: float, py: float, edges: tuple[tuple[float, float, float, float, float], ...]) -> float:
+    """min_distance_to_edges against a _prepare_polygon_edges table."""
+    best = math.inf
+    for ax, ay, vx, vy, d2 in edges:
+        wx, wy = px - ax, py - ay
+        if d2 <= 0:
+            d = math.sqrt(wx * wx + wy * wy)
+        else:
+            t = max(0.0, min(1.0, (wx * vx + wy * vy) / d2))
+            qx = px - (ax + t * vx)
+            qy = py - (ay + t * vy)
+            d = math.sqrt(qx * qx + qy * qy)
+        if d < best:
+            best = d
+    return best
+
+
+def _edges_clear_of(px: float, py: float, edges: tuple[tuple[float, float, float, float, float], ...], margin_sq: float) -> bool:
+    """True if (px, py) is at least sqrt(margin_sq) from every edge. Compares squared distances, so the per-edge sqrt of _min_edge_distance is skipped and the scan exits on the first edge that is too near."""
+    for ax, ay, vx, vy, d2 in edges:
+        wx, wy = px - ax, py - ay
+        if d2 <= 0:
+            if wx * wx + wy * wy < margin_sq:
+                return False
+        else:
+            t = max(0.0, min(1.0, (wx * vx + wy * vy) / d2))
+            qx = wx - t * vx
+            qy = wy - t * vy
+            if qx * qx + qy * qy < margin_sq:
+                return False
+    return True
+
+
+def _point_in_convex_edges(px: float, py: float, edges: tuple[tuple[float, float, float, float, float], ...]) -> bool:
+    """point_in_convex_polygon against a _prepare_polygon_edges table (vertices counterclockwise)."""
+    for ax, ay, vx, vy, _d2 in edges:
+        if vx * (py - ay) - vy * (px - ax) < 0:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=64)
+def _prepare_polygon_ray(vertices: tuple[tuple[float, float], ...]) -> tuple[tuple[float, float, float, float], ...]:
+    """Per-edge (yi, yj, xi, slope) table for the ray-cast test, with slope = (xj-xi)/(yj-yi) precomputed so the inner loop has no division. Horizontal edges are dropped: the crossing test never selects them."""
+    tab: list[tuple[float, float, float, float]] = []
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
+        if yi != yj:
+            tab.append((yi, yj, xi, (xj - xi) / (yj - yi)))
+        xj, yj = xi, yi
+    return tuple(tab)
+
+
+def _point_in_polygon_ray_tab(px: float, py: float, tab: tuple[tuple[float, float, float, float], ...]) -> bool:
+    """point_in_polygon_ray against a _prepare_polygon_ray table."""
+    inside = False
+    for yi, yj, xi, slope in tab:
+        if ((yi > py) != (yj > py)) and (px < slope * (py - yi) + xi):
+            inside = not inside
+    return inside
+
+
+# Shapes whose placement test can use the cheaper convex containment check
+_CONVEX_SHAPES = ("square", "triangle", "pentagon", "hexagon", "heptagon", "octagon", "right_angled_triangle", "rectangle")
+
+
+def make_inside_check(shape: str, vertices: list[tuple[float, float]] | None) -> Callable[[float, float], bool]:
+    """Build the motif placement inside-test for `shape`, specialized once up front. The shape is fixed for a whole run, so each returned closure contains only the math its shape needs (no per-candidate shape dispatch), with margins, tables and helpers baked in as default arguments so the hot loop reads them as locals."""
+    if shape == "circle":
+        r2 = (CIRCLE_RADIUS - CELL_HALF) ** 2
+
+        def check_circle(cx: float, cy: float, r2: float = r2) -> bool:
+            dx, dy = cx - 50.0, cy - 50.0
+            return dx * dx + dy * dy <= r2
+
+        return check_circle
+
+    if shape == "semicircle":
+        # Vertically centred: circle centre (50, 67.5), flat at bottom (y=67.5). Inside with margin.
+        cy_centre = 67.5
+        arc_top_y = cy_centre - SEMICIRCLE_RADIUS
+        r2 = (SEMICIRCLE_RADIUS - CELL_HALF) ** 2
+        y_lo = arc_top_y + CELL_HALF
+        y_hi = cy_centre - CELL_HALF
+
+        def check_semicircle(cx: float, cy: float, y_lo: float = y_lo, y_hi: float = y_hi, cy_centre: float = cy_centre, r2: float = r2) -> bool:
+            if cy > y_hi or cy < y_lo:  # margin from flat and from arc top
+                return False
+            dx, dy = cx - 50.0, cy - cy_centre
+            return dx * dx + dy * dy <= r2
+
+        return check_semicircle
+
+    if not vertices:
+        return lambda cx, cy: False
+
+    # Inset bbox pre-reject: any point at least `margin` from every edge is
+    # also at least `margin` inside the bbox, so points outside the inset
+    # bbox are rejected without the per-edge scan.
+    margin = TRIANGLE_EDGE_MARGIN if shape == "triangle" else CELL_HALF
+    xs = [v[0] for v in vertices]
+    ys = [v[1] for v in vertices]
+    lo_x, hi_x = min(xs) + margin, max(xs) - margin
+    lo_y, hi_y = min(ys) + margin, max(ys) - margin
+    edges = _prepare_polygon_edges(tuple(vertices))
+    margin_sq = margin * margin
+
+    if shape == "cross":
+        # The cross is two axis-aligned bars, so "inside with CROSS_EDGE_MARGIN
+        # clearance" collapses to containment in either margin-shrunk bar: two
+        # range checks instead of a 12-edge distance scan. (Slightly stricter
+        # than true erosion in the quarter-disc slivers at the four reentrant
+        # corners; the cross sampler never lands there.)
+        inner_lo, inner_hi = CROSS_INNER_LO + CROSS_EDGE_MARGIN, CROSS_INNER_HI - CROSS_EDGE_MARGIN
+        outer_lo, outer_hi = CROSS_OUTER_LO + CROSS_EDGE_MARGIN, CROSS_OUTER_HI - CROSS_EDGE_MARGIN
+
+        def check_cross(cx: float, cy: float, inner_lo=inner_lo, inner_hi=inner_hi, outer_lo=outer_lo, outer_hi=outer_hi) -> bool:
+            return (
+                (inner_lo <= cx <= inner_hi and outer_lo <= cy <= outer_hi)
+                or (outer_lo <= cx <= outer_hi and inner_lo <= cy <= inner_hi)
+            )
+
+        return check_cross
+
+    if shape in _CONVEX_SHAPES:
+        def check_convex(cx: float, cy: float, lo_x=lo_x, hi_x=hi_x, lo_y=lo_y, hi_y=hi_y, edges=edges, margin_sq=margin_sq, _in_convex=_point_in_convex_edges, _clear=_edges_clear_of) -> bool:
+            if not (lo_x <= cx <= hi_x and lo_y <= cy <= hi_y):
+                return False
+            return _in_convex(cx, cy, edges) and _clear(cx, cy, edges, margin_sq)
+
+        return check_convex
+
+    ray_tab = _prepare_polygon_ray(tuple(vertices))
+
+    def check_polygon(cx: float, cy: float, lo_x=lo_x, hi_x=hi_x, lo_y=lo_y, hi_y=hi_y, ray_tab=ray_tab, edges=edges, margin_sq=margin_sq, _in_ray=_point_in_polygon_ray_tab, _clear=_edges_clear_of) -> bool:
+        if not (lo_x <= cx <= hi_x and lo_y <= cy <= hi_y):
+            return False
+        return _in_ray(cx, cy, ray_tab) and _clear(cx, cy, edges, margin_sq)
+
+    return check_polygon
 
 
 # ----- Irregular shapes (guide §3.1 common irregular) -----
@@ -424,18 +830,11 @@ CROSS_PATH_D = (
 
 
 def _point_in_cross(x: float, y: float) -> bool:
-    """True if (x,y) is inside the cross (center + 4 arms), excluding the four corner regions."""
-    if CROSS_INNER_LO <= x <= CROSS_INNER_HI and CROSS_INNER_LO <= y <= CROSS_INNER_HI:
-        return True  # center
-    if CROSS_INNER_LO <= x <= CROSS_INNER_HI and CROSS_OUTER_LO <= y < CROSS_INNER_LO:
-        return True  # top arm
-    if CROSS_INNER_LO <= x <= CROSS_INNER_HI and CROSS_INNER_HI < y <= CROSS_OUTER_HI:
-        return True  # bottom arm
-    if CROSS_OUTER_LO <= x < CROSS_INNER_LO and CROSS_INNER_LO <= y <= CROSS_INNER_HI:
-        return True  # left arm
-    if CROSS_INNER_HI < x <= CROSS_OUTER_HI and CROSS_INNER_LO <= y <= CROSS_INNER_HI:
-        return True  # right arm
-    return False
+    """True if (x,y) is inside the cross (center + 4 arms), excluding the four corner regions. The cross is the union of the vertical bar and the horizontal bar, so two range checks cover all five regions."""
+    return (
+        (CROSS_INNER_LO <= x <= CROSS_INNER_HI and CROSS_OUTER_LO <= y <= CROSS_OUTER_HI)
+        or (CROSS_OUTER_LO <= x <= CROSS_OUTER_HI and CROSS_INNER_LO <= y <= CROSS_INNER_HI)
+    )
 
 
 # Five rectangles inset by CROSS_SAMPLE_INSET: (x_min, x_max, y_min, y_max)
@@ -448,10 +847,23 @@ _CROSS_RECTS = [
 ]
 
 
+# Pick rectangles in proportion to their area so sampling is uniform over the
+# cross interior: the centre square is larger than the arms, so an unweighted
+# choice would under-sample it. Cumulative distribution for bisect lookup.
+_CROSS_AREAS = [(x_hi - x_lo) * (y_hi - y_lo) for x_lo, x_hi, y_lo, y_hi in _CROSS_RECTS]
+_CROSS_CDF = [sum(_CROSS_AREAS[: i + 1]) / sum(_CROSS_AREAS) for i in range(len(_CROSS_AREAS))]
+
+
+# Rects as (x_lo, width_x, y_lo, width_y): lo + width * random() matches
+# rng.uniform bit-for-bit with the subtractions done once up front.
+_CROSS_SAMPLE_RECTS = [(x_lo, x_hi - x_lo, y_lo, y_hi - y_lo) for x_lo, x_hi, y_lo, y_hi in _CROSS_RECTS]
+
+
 def _cross_sample_point(rng: random.Random) -> tuple[float, float]:
-    """Return a random point inside the insetted cross rectangles (well clear of notches)."""
-    x_lo, x_hi, y_lo, y_hi = rng.choice(_CROSS_RECTS)
-    return (rng.uniform(x_lo, x_hi), rng.uniform(y_lo, y_hi))
+    """Return a random point inside the insetted cross rectangles (well clear of notches), uniform by area across the rectangles."""
+    rand = rng.random
+    x_lo, width_x, y_lo, width_y = _CROSS_SAMPLE_RECTS[bisect.bisect_left(_CROSS_CDF, rand())]
+    return (x_lo + width_x * rand(), y_lo + width_y * rand())
 
 
 def _cross_geometry() -> tuple[list[tuple[float, float]], str, None, None]:
@@ -473,34 +885,20 @@ def _arrow_geometry() -> tuple[list[tuple[float, float]], str]:
 
 # ----- Symbol containers (guide §3.1): load from shape-{symbol}.svg, same outlines as motifs -----
 
+_PATH_TOKEN_RE = re.compile(r"([MLHVCSQTAZmlhvcsqtaz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+
+
 def _path_d_tokenize(path_d: str) -> list[tuple[str, list[float]]]:
-    """Parse SVG path d into list of (command, numbers). Handles M,L,H,V,C,Q,A,Z and repeated implicit commands."""
+    """Parse SVG path d into list of (command, numbers). Handles M,L,H,V,C,Q,A,Z and repeated implicit commands. One precompiled-regex pass over the string; the old version resliced the remainder per number, which was quadratic on long symbol paths."""
     tokens: list[tuple[str, list[float]]] = []
-    rest = re.sub(r",", " ", path_d.strip())
-    pos = 0
-    while pos < len(rest):
-        while pos < len(rest) and rest[pos] in " \t\n":
-            pos += 1
-        if pos >= len(rest):
-            break
-        if rest[pos] in "MLHVCSQTAZmlhvcsqtaz":
-            cmd = rest[pos].upper()
-            pos += 1
-            nums: list[float] = []
-            while pos < len(rest):
-                while pos < len(rest) and rest[pos] in " \t\n":
-                    pos += 1
-                if pos >= len(rest) or rest[pos] in "MLHVCSQTAZmlhvcsqtaz":
-                    break
-                m = re.match(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?", rest[pos:])
-                if m:
-                    nums.append(float(m.group(0)))
-                    pos += m.end()
-                else:
-                    break
-            tokens.append((cmd, nums))
-            continue
-        pos += 1
+    nums: list[float] | None = None
+    for m in _PATH_TOKEN_RE.finditer(path_d):
+        cmd = m.group(1)
+        if cmd is not None:
+            nums = []
+            tokens.append((cmd.upper(), nums))
+        elif nums is not None:
+            nums.append(float(m.group(2)))
     return tokens
 
 
@@ -832,6 +1230,7 @@ def _serialize_path_el(path_el: ET.Element) -> str:
     return f"<path {attrs}/>" if attrs else "<path/>"
 
 
+@functools.lru_cache(maxsize=64)
 def _load_symbol_svg(motifs_dir: Path, shape: str) -> tuple[str, str | None, str]:
     """Load shape-{shape}.svg; return (path_d, transform_attr or None, path_element_xml). path_element_xml is the template <path .../> for drawing/concentric. Handles <g transform="rotate(...)"><path/></g>."""
     path = motifs_dir / f"shape-{shape}.svg"
@@ -860,7 +1259,7 @@ def _parse_rotate_transform(transform_attr: str | None) -> tuple[float, float, f
     if not transform_attr or "rotate" not in transform_attr:
         return None
     # Match rotate(angle cx cy) or rotate(angle, cx, cy)
-    m = re.search(r"rotate\s*\(\s*([-\d.]+)\s*[, ]\s*([-\d.]+)\s*[, ]\s*([-\d.]+)\s*\)", transform_attr, re.IGNORECASE)
+    m = _ROTATE_TRANSFORM_RE.search(transform_attr)
     if not m:
         return None
     angle = float(m.group(1))
@@ -907,15 +1306,36 @@ def get_shape_geometry(shape: str, motifs_dir: Path | None = None) -> tuple[list
     For cross: path_d_stroke is None, stroke_lines is 12 (x1,y1,x2,y2) segments. Otherwise stroke_lines is None.
     For symbol containers, symbol_transform is the parent <g> transform from the SVG when present; symbol_path_element is the template <path .../> from the file for concentric/drawing.
     For symbol containers (plus, times, club, heart, diamond, spade, star), motifs_dir is required to load shape-{symbol}.svg.
+    Geometry is built once per (shape, motifs_dir) and cached; the vertex list is copied per call so callers cannot mutate cached state.
     """
-    shape = (shape or "").strip().lower()
+    vertices, path_d, path_d_stroke, stroke_lines, symbol_transform, symbol_path_element = _shape_geometry_cached(
+        (shape or "").strip().lower(), motifs_dir
+    )
+    return list(vertices), path_d, path_d_stroke, stroke_lines, symbol_transform, symbol_path_element
+
+
+def _shape_geometry_cached(shape: str, motifs_dir: Path | None):
+    geometry = _STATIC_SHAPE_GEOMETRY.get(shape)
+    if geometry is not None:
+        return geometry
     if shape in SHAPES_SYMBOLS:
         if motifs_dir is None:
             script_dir = Path(__file__).resolve().parent
             _repo_root = script_dir.parent.parent if script_dir.name == "lib" else script_dir.parent
             motifs_dir = _repo_root / "nvr-symbols"
-        vertices, path_d, symbol_transform, symbol_path_element = _symbol_geometry(shape, motifs_dir)
-        return vertices, path_d, None, None, symbol_transform, symbol_path_element
+        return _symbol_shape_geometry(shape, motifs_dir)
+    raise ValueError(f"Unknown shape: {shape!r}. Supported: {SHAPES_ALL}")
+
+
+@functools.lru_cache(maxsize=64)
+def _symbol_shape_geometry(shape: str, motifs_dir: Path):
+    """Load-and-parse geometry for a symbol container, cached per (shape, motifs_dir)."""
+    vertices, path_d, symbol_transform, symbol_path_element = _symbol_geometry(shape, motifs_dir)
+    return vertices, path_d, None, None, symbol_transform, symbol_path_element
+
+
+def _build_static_geometry(shape: str):
+    """Construct geometry for a non-symbol shape; these depend only on module constants, so they are tabulated once at import."""
     if shape == "right_angled_triangle":
         v, p = _right_angled_triangle_geometry()
         return v, p, None, None, None, None
@@ -951,6 +1371,12 @@ def get_shape_geometry(shape: str, motifs_dir: Path | None = None) -> tuple[list
     return vertices, path_d, None, None, None, None
 
 
+# Non-symbol geometry tabulated once at import; after startup
+# get_shape_geometry for these shapes is a plain dict lookup. Symbol
+# containers need motifs_dir and file I/O, so they stay lazily cached.
+_STATIC_SHAPE_GEOMETRY = {s: _build_static_geometry(s) for s in SHAPES_REGULAR + SHAPES_IRREGULAR}
+
+
 # Partition (guide §3.9): thin lines between sections
 PARTITION_LINE_STROKE = 0.8
 
@@ -999,9 +1425,7 @@ def _clip_polygon_half_plane(
 ) -> list[tuple[float, float]]:
     """Sutherland-Hodgman: clip polygon to half-plane. intersect(a,b) returns crossing point."""
     out: list[tuple[float, float]] = []
-    n = len(vertices)
-    for i in range(n):
-        a, b = vertices[i], vertices[(i + 1) % n]
+    for a, b in zip(vertices, vertices[1:] + vertices[:1]):
         a_in, b_in = inside(a[0], a[1]), inside(b[0], b[1])
         if a_in:
             out.append(a)
@@ -1017,27 +1441,24 @@ def _clip_polygon_to_horizontal_band(
     y_lo: float,
     y_hi: float,
 ) -> list[tuple[float, float]]:
-    """Clip polygon to horizontal band y_lo <= y <= y_hi."""
-
-    def intersect_y(a: tuple[float, float], b: tuple[float, float], y: float) -> tuple[float, float]:
-        ax, ay, bx, by = a[0], a[1], b[0], b[1]
-        if abs(by - ay) < 1e-9:
-            return (ax + bx) / 2, y
-        t = (y - ay) / (by - ay)
-        t = max(0, min(1, t))
-        return (ax + t * (bx - ax), y)
-
-    step1 = _clip_polygon_half_plane(
-        vertices,
-        lambda x, y: y >= y_lo,
-        lambda a, b: intersect_y(a, b, y_lo),
-    )
-    step2 = _clip_polygon_half_plane(
-        step1,
-        lambda x, y: y <= y_hi,
-        lambda a, b: intersect_y(a, b, y_hi),
-    )
-    return step2
+    """Clip polygon to horizontal band y_lo <= y <= y_hi. Both Sutherland-Hodgman passes run with the inside test and intersection arithmetic inlined (no per-edge callbacks)."""
+    poly = vertices
+    for bound, keep_ge in ((y_lo, True), (y_hi, False)):
+        out: list[tuple[float, float]] = []
+        for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+            a_in = (ay >= bound) if keep_ge else (ay <= bound)
+            b_in = (by >= bound) if keep_ge else (by <= bound)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                if abs(by - ay) < 1e-9:
+                    out.append(((ax + bx) / 2, bound))
+                else:
+                    t = (bound - ay) / (by - ay)
+                    t = max(0, min(1, t))
+                    out.append((ax + t * (bx - ax), bound))
+        poly = out
+    return poly
 
 
 def _clip_polygon_to_vertical_band(
@@ -1045,27 +1466,24 @@ def _clip_polygon_to_vertical_band(
     x_lo: float,
     x_hi: float,
 ) -> list[tuple[float, float]]:
-    """Clip polygon to vertical band x_lo <= x <= x_hi."""
-
-    def intersect_x(a: tuple[float, float], b: tuple[float, float], x: float) -> tuple[float, float]:
-        ax, ay, bx, by = a[0], a[1], b[0], b[1]
-        if abs(bx - ax) < 1e-9:
-            return x, (ay + by) / 2
-        t = (x - ax) / (bx - ax)
-        t = max(0, min(1, t))
-        return (x, ay + t * (by - ay))
-
-    step1 = _clip_polygon_half_plane(
-        vertices,
-        lambda x, y: x >= x_lo,
-        lambda a, b: intersect_x(a, b, x_lo),
-    )
-    step2 = _clip_polygon_half_plane(
-        step1,
-        lambda x, y: x <= x_hi,
-        lambda a, b: intersect_x(a, b, x_hi),
-    )
-    return step2
+    """Clip polygon to vertical band x_lo <= x <= x_hi (inlined two-pass clip)."""
+    poly = vertices
+    for bound, keep_ge in ((x_lo, True), (x_hi, False)):
+        out: list[tuple[float, float]] = []
+        for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+            a_in = (ax >= bound) if keep_ge else (ax <= bound)
+            b_in = (bx >= bound) if keep_ge else (bx <= bound)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                if abs(bx - ax) < 1e-9:
+                    out.append((bound, (ay + by) / 2))
+                else:
+                    t = (bound - ax) / (bx - ax)
+                    t = max(0, min(1, t))
+                    out.append((bound, ay + t * (by - ay)))
+        poly = out
+    return poly
 
 
 def _clip_polygon_to_diagonal_slash_band(
@@ -1073,28 +1491,25 @@ def _clip_polygon_to_diagonal_slash_band(
     k_lo: float,
     k_hi: float,
 ) -> list[tuple[float, float]]:
-    """Clip polygon to diagonal slash band: k_lo <= (x+y) <= k_hi."""
-
-    def intersect_slash(a: tuple[float, float], b: tuple[float, float], k: float) -> tuple[float, float]:
-        ax, ay, bx, by = a[0], a[1], b[0], b[1]
-        denom = (bx - ax) + (by - ay)
-        if abs(denom) < 1e-9:
-            return (ax + bx) / 2, (ay + by) / 2
-        t = (k - ax - ay) / denom
-        t = max(0.0, min(1.0, t))
-        return (ax + t * (bx - ax), ay + t * (by - ay))
-
-    step1 = _clip_polygon_half_plane(
-        vertices,
-        lambda x, y: (x + y) >= k_lo,
-        lambda a, b: intersect_slash(a, b, k_lo),
-    )
-    step2 = _clip_polygon_half_plane(
-        step1,
-        lambda x, y: (x + y) <= k_hi,
-        lambda a, b: intersect_slash(a, b, k_hi),
-    )
-    return step2
+    """Clip polygon to diagonal slash band: k_lo <= (x+y) <= k_hi (inlined two-pass clip)."""
+    poly = vertices
+    for bound, keep_ge in ((k_lo, True), (k_hi, False)):
+        out: list[tuple[float, float]] = []
+        for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+            a_in = (ax + ay >= bound) if keep_ge else (ax + ay <= bound)
+            b_in = (bx + by >= bound) if keep_ge else (bx + by <= bound)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                denom = (bx - ax) + (by - ay)
+                if abs(denom) < 1e-9:
+                    out.append(((ax + bx) / 2, (ay + by) / 2))
+                else:
+                    t = (bound - ax - ay) / denom
+                    t = max(0.0, min(1.0, t))
+                    out.append((ax + t * (bx - ax), ay + t * (by - ay)))
+        poly = out
+    return poly
 
 
 def _clip_polygon_to_diagonal_backslash_band(
@@ -1102,28 +1517,25 @@ def _clip_polygon_to_diagonal_backslash_band(
     k_lo: float,
     k_hi: float,
 ) -> list[tuple[float, float]]:
-    """Clip polygon to diagonal backslash band: k_lo <= (x-y) <= k_hi."""
-
-    def intersect_backslash(a: tuple[float, float], b: tuple[float, float], k: float) -> tuple[float, float]:
-        ax, ay, bx, by = a[0], a[1], b[0], b[1]
-        denom = (bx - ax) - (by - ay)
-        if abs(denom) < 1e-9:
-            return (ax + bx) / 2, (ay + by) / 2
-        t = (k - ax + ay) / denom
-        t = max(0.0, min(1.0, t))
-        return (ax + t * (bx - ax), ay + t * (by - ay))
-
-    step1 = _clip_polygon_half_plane(
-        vertices,
-        lambda x, y: (x - y) >= k_lo,
-        lambda a, b: intersect_backslash(a, b, k_lo),
-    )
-    step2 = _clip_polygon_half_plane(
-        step1,
-        lambda x, y: (x - y) <= k_hi,
-        lambda a, b: intersect_backslash(a, b, k_hi),
-    )
-    return step2
+    """Clip polygon to diagonal backslash band: k_lo <= (x-y) <= k_hi (inlined two-pass clip)."""
+    poly = vertices
+    for bound, keep_ge in ((k_lo, True), (k_hi, False)):
+        out: list[tuple[float, float]] = []
+        for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+            a_in = (ax - ay >= bound) if keep_ge else (ax - ay <= bound)
+            b_in = (bx - by >= bound) if keep_ge else (bx - by <= bound)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                denom = (bx - ax) - (by - ay)
+                if abs(denom) < 1e-9:
+                    out.append(((ax + bx) / 2, (ay + by) / 2))
+                else:
+                    t = (bound - ax + ay) / denom
+                    t = max(0.0, min(1.0, t))
+                    out.append((ax + t * (bx - ax), ay + t * (by - ay)))
+        poly = out
+    return poly
 
 
 def _clip_polygon_to_polygon(
@@ -1182,45 +1594,41 @@ def _clip_segment_to_polygon(
     x1: float, y1: float, x2: float, y2: float,
     vertices: list[tuple[float, float]],
 ) -> list[tuple[float, float, float, float]]:
-    """Clip the segment (x1,y1)-(x2,y2) to the interior of the polygon (counterclockwise). Returns list of (xa,ya,xb,yb) segments that lie inside (at most one for convex)."""
+    """Clip the segment (x1,y1)-(x2,y2) to the interior of the polygon (convex, counterclockwise). Returns list of (xa,ya,xb,yb) segments that lie inside (at most one for convex).
+
+    Cyrus-Beck: one pass over the edges tracking the entry/exit parameters
+    [t_in, t_out] of the segment, bailing out as soon as the interval is
+    empty, instead of re-clipping the endpoints edge by edge.
+    """
     if not vertices or len(vertices) < 3:
         return [(x1, y1, x2, y2)]
-    p1, p2 = (x1, y1), (x2, y2)
-    n = len(vertices)
-    for i in range(n):
-        e0 = vertices[i]
-        e1 = vertices[(i + 1) % n]
-        ex, ey = e1[0] - e0[0], e1[1] - e0[1]
-        # inside: to the left of edge for CCW  =>  ex*(py - e0[1]) - ey*(px - e0[0]) >= 0
-        def cross_sign(px: float, py: float) -> float:
-            return ex * (py - e0[1]) - ey * (px - e0[0])
-        c1, c2 = cross_sign(p1[0], p1[1]), cross_sign(p2[0], p2[1])
-        if c1 >= -1e-9 and c2 >= -1e-9:
-            continue
-        if c1 < -1e-9 and c2 < -1e-9:
-            return []
-        dx, dy = p2[0] - p1[0], p2[1] - p1[1]
+    dx, dy = x2 - x1, y2 - y1
+    t_in, t_out = 0.0, 1.0
+    ax, ay = vertices[-1]
+    for bx, by in vertices:
+        ex, ey = bx - ax, by - ay
+        # f(t) = c1 + t*denom, where f >= 0 means inside (left of CCW edge)
+        c1 = ex * (y1 - ay) - ey * (x1 - ax)
         denom = ex * dy - ey * dx
         if abs(denom) < 1e-12:
-            return []
-        t = (ex * (e0[1] - p1[1]) - ey * (e0[0] - p1[0])) / denom
-        t = max(0.0, min(1.0, t))
-        mid = (p1[0] + t * dx, p1[1] + t * dy)
-        # Avoid collapsing to a point when the segment passes through a vertex (mid equals p1 or p2)
-        if c1 >= -1e-9:
-            if (mid[0] - p1[0]) ** 2 + (mid[1] - p1[1]) ** 2 < 1e-18:
-                p1 = mid  # keep p2 so a later edge clips to the other intersection
-            else:
-                p2 = mid
+            if c1 < -1e-9:
+                return []  # parallel and fully outside this edge
+        elif denom > 0:
+            t = -c1 / denom  # entering
+            if t > t_in:
+                t_in = t
         else:
-            if (mid[0] - p2[0]) ** 2 + (mid[1] - p2[1]) ** 2 < 1e-18:
-                p2 = mid
-            else:
-                p1 = mid
-    seg = (p1[0], p1[1], p2[0], p2[1])
-    if (seg[2] - seg[0]) ** 2 + (seg[3] - seg[1]) ** 2 < 1e-18:
+            t = -c1 / denom  # exiting
+            if t < t_out:
+                t_out = t
+        if t_in > t_out:
+            return []
+        ax, ay = bx, by
+    xa, ya = x1 + t_in * dx, y1 + t_in * dy
+    xb, yb = x1 + t_out * dx, y1 + t_out * dy
+    if (xb - xa) ** 2 + (yb - ya) ** 2 < 1e-18:
         return []
-    return [seg]
+    return [(xa, ya, xb, yb)]
 
 
 def _clip_segment_to_circle(
@@ -1266,18 +1674,39 @@ def _polygon_path_d(vertices: list[tuple[float, float]]) -> str:
     """SVG path d for a polygon from vertices."""
     if not vertices:
         return ""
-    return "M " + " L ".join(f"{x:.2f} {y:.2f}" for x, y in vertices) + " Z"
+    return _polygon_path_d_cached(tuple(vertices))
+
+
+@functools.lru_cache(maxsize=256)
+def _polygon_path_d_cached(vertices: tuple[tuple[float, float], ...]) -> str:
+    """Formatted path per exact vertex tuple; partitioned sections and batch runs re-request the same polygons."""
+    buf = [f"M {vertices[0][0]:.2f} {vertices[0][1]:.2f}"]
+    buf.extend(f"L {x:.2f} {y:.2f}" for x, y in vertices[1:])
+    buf.append("Z")
+    return " ".join(buf)
+
+
+def _fmt(x: float) -> str:
+    """Shortest fixed-point coordinate: up to 3 decimals with trailing zeros stripped ("3.000" -> "3", "12.340" -> "12.34"). Keeps partition path strings compact."""
+    s = f"{x:.3f}".rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
 
 
 def _circle_annulus_path(cx: float, cy: float, r_outer: float, r_inner: float) -> str:
     """Path for annulus (ring): outer circle then inner circle, fill-rule evenodd."""
-    d_outer = f"M {cx} {cy - r_outer} A {r_outer} {r_outer} 0 0 1 {cx} {cy + r_outer} A {r_outer} {r_outer} 0 0 1 {cx} {cy - r_outer} Z"
-    d_inner = f" M {cx} {cy + r_inner} A {r_inner} {r_inner} 0 0 1 {cx} {cy - r_inner} A {r_inner} {r_inner} 0 0 1 {cx} {cy + r_inner} Z"
+    fcx, fro, fri = _fmt(cx), _fmt(r_outer), _fmt(r_inner)
+    d_outer = f"M {fcx} {_fmt(cy - r_outer)} A {fro} {fro} 0 0 1 {fcx} {_fmt(cy + r_outer)} A {fro} {fro} 0 0 1 {fcx} {_fmt(cy - r_outer)} Z"
+    d_inner = f" M {fcx} {_fmt(cy + r_inner)} A {fri} {fri} 0 0 1 {fcx} {_fmt(cy - r_inner)} A {fri} {fri} 0 0 1 {fcx} {_fmt(cy + r_inner)} Z"
     return d_outer + d_inner
 
 
 def _polygon_centroid(vertices: list[tuple[float, float]]) -> tuple[float, float]:
-    """Area centroid (center of mass) of polygon; vertices counterclockwise. Falls back to vertex average if area ~0."""
+    """Area centroid (center of mass) of polygon; vertices counterclockwise. Falls back to vertex average if area ~0. Cached per vertex tuple: the partition branches ask for the same container centroid once per section."""
+    return _polygon_centroid_cached(tuple(vertices))
+
+
+@functools.lru_cache(maxsize=64)
+def _polygon_centroid_cached(vertices: tuple[tuple[float, float], ...]) -> tuple[float, float]:
     n = len(vertices)
     if n == 0:
         return (50.0, 50.0)
@@ -1314,8 +1743,18 @@ def _scaled_polygon_vertices(
     cy: float,
     scale: float,
 ) -> list[tuple[float, float]]:
-    """Vertices scaled from centre (cx, cy) by scale (0 = point, 1 = same)."""
-    return [(cx + scale * (v[0] - cx), cy + scale * (v[1] - cy)) for v in vertices]
+    """Vertices scaled from centre (cx, cy) by scale (0 = point, 1 = same). Cached per exact inputs: concentric partitions request the same ring twice (band i's outer is band i+1's inner)."""
+    return list(_scaled_polygon_vertices_cached(tuple(vertices), cx, cy, scale))
+
+
+@functools.lru_cache(maxsize=128)
+def _scaled_polygon_vertices_cached(
+    vertices: tuple[tuple[float, float], ...],
+    cx: float,
+    cy: float,
+    scale: float,
+) -> tuple[tuple[float, float], ...]:
+    return tuple((cx + scale * (vx - cx), cy + scale * (vy - cy)) for vx, vy in vertices)
 
 
 def _polygon_ring_path(
@@ -1328,8 +1767,8 @@ def _polygon_ring_path(
     """Path for polygon ring (region between inner and outer scaled polygon), fill-rule evenodd."""
     outer = _scaled_polygon_vertices(vertices, cx, cy, scale_hi / 100.0)
     inner = _scaled_polygon_vertices(vertices, cx, cy, scale_lo / 100.0)
-    d_outer = _polygon_path_d(outer)
-    d_inner = " M " + " L ".join(f"{x:.2f} {y:.2f}" for x, y in inner) + " Z"
+    d_outer = "M " + " L ".join(f"{_fmt(x)} {_fmt(y)}" for x, y in outer) + " Z"
+    d_inner = " M " + " L ".join(f"{_fmt(x)} {_fmt(y)}" for x, y in inner) + " Z"
     return d_outer + d_inner
 
 
@@ -1339,7 +1778,8 @@ def _circle_wedge_path(cx: float, cy: float, r: float, angle_start: float, angle
     y0 = cy + r * math.sin(angle_start)
     x1 = cx + r * math.cos(angle_end)
     y1 = cy + r * math.sin(angle_end)
-    return f"M {cx:.2f} {cy:.2f} L {x0:.2f} {y0:.2f} A {r:.2f} {r:.2f} 0 0 1 {x1:.2f} {y1:.2f} Z"
+    fr = _fmt(r)
+    return f"M {_fmt(cx)} {_fmt(cy)} L {_fmt(x0)} {_fmt(y0)} A {fr} {fr} 0 0 1 {_fmt(x1)} {_fmt(y1)} Z"
 
 
 def _quadrant_rect(cx: float, cy: float, quadrant: int) -> list[tuple[float, float]]:
@@ -1354,6 +1794,48 @@ def _quadrant_rect(cx: float, cy: float, quadrant: int) -> list[tuple[float, flo
     return [(0, cy), (cx, cy), (cx, 100), (0, 100)]
 
 
+def _clip_polygon_half_plane_axis(
+    vertices: list[tuple[float, float]],
+    axis: int,
+    keep_le: bool,
+    k: float,
+) -> list[tuple[float, float]]:
+    """Clip polygon to an axis-aligned half-plane: axis 0 keeps x<=k (or x>=k when keep_le is false), axis 1 the same for y. The axis branch is resolved once, outside the vertex loop, and the intersection is computed inline."""
+    # Common case: the polygon lies entirely inside the half-plane and the
+    # pass would rebuild it unchanged - detect that with one cheap scan.
+    if axis == 0:
+        untouched = all(v[0] <= k for v in vertices) if keep_le else all(v[0] >= k for v in vertices)
+    else:
+        untouched = all(v[1] <= k for v in vertices) if keep_le else all(v[1] >= k for v in vertices)
+    if untouched:
+        return vertices
+    out: list[tuple[float, float]] = []
+    rot = vertices[1:] + vertices[:1]
+    if axis == 0:
+        for (ax, ay), (bx, by) in zip(vertices, rot):
+            a_in = (ax <= k) if keep_le else (ax >= k)
+            b_in = (bx <= k) if keep_le else (bx >= k)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                # ax != bx here: equal coordinates give equal inside flags,
+                # so the crossing branch never divides by zero.
+                t = (k - ax) / (bx - ax)
+                t = max(0.0, min(1.0, t))
+                out.append((k, ay + t * (by - ay)))
+    else:
+        for (ax, ay), (bx, by) in zip(vertices, rot):
+            a_in = (ay <= k) if keep_le else (ay >= k)
+            b_in = (by <= k) if keep_le else (by >= k)
+            if a_in:
+                out.append((ax, ay))
+            if a_in != b_in:
+                t = (k - ay) / (by - ay)
+                t = max(0.0, min(1.0, t))
+                out.append((ax + t * (bx - ax), k))
+    return out
+
+
 def _clip_polygon_to_quadrant(
     vertices: list[tuple[float, float]],
     cx: float,
@@ -1361,60 +1843,8 @@ def _clip_polygon_to_quadrant(
     quadrant: int,
 ) -> list[tuple[float, float]]:
     """Clip polygon to quadrant (0=top-left x<=cx y<=cy, 1=top-right x>=cx y<=cy, 2=bottom-right x>=cx y>=cy, 3=bottom-left x<=cx y>=cy)."""
-    if quadrant == 0:
-        step1 = _clip_polygon_half_plane(
-            vertices, lambda x, y: x <= cx,
-            lambda a, b: _intersect_vertical(a, b, cx),
-        )
-        return _clip_polygon_half_plane(
-            step1, lambda x, y: y <= cy,
-            lambda a, b: _intersect_horizontal(a, b, cy),
-        )
-    if quadrant == 1:
-        step1 = _clip_polygon_half_plane(
-            vertices, lambda x, y: x >= cx,
-            lambda a, b: _intersect_vertical(a, b, cx),
-        )
-        return _clip_polygon_half_plane(
-            step1, lambda x, y: y <= cy,
-            lambda a, b: _intersect_horizontal(a, b, cy),
-        )
-    if quadrant == 2:
-        step1 = _clip_polygon_half_plane(
-            vertices, lambda x, y: x >= cx,
-            lambda a, b: _intersect_vertical(a, b, cx),
-        )
-        return _clip_polygon_half_plane(
-            step1, lambda x, y: y >= cy,
-            lambda a, b: _intersect_horizontal(a, b, cy),
-        )
-    # quadrant == 3
-    step1 = _clip_polygon_half_plane(
-        vertices, lambda x, y: x <= cx,
-        lambda a, b: _intersect_vertical(a, b, cx),
-    )
-    return _clip_polygon_half_plane(
-        step1, lambda x, y: y >= cy,
-        lambda a, b: _intersect_horizontal(a, b, cy),
-    )
-
-
-def _intersect_vertical(a: tuple[float, float], b: tuple[float, float], x: float) -> tuple[float, float]:
-    ax, ay, bx, by = a[0], a[1], b[0], b[1]
-    if abs(bx - ax) < 1e-9:
-        return (x, (ay + by) / 2)
-    t = (x - ax) / (bx - ax)
-    t = max(0.0, min(1.0, t))
-    return (x, ay + t * (by - ay))
-
-
-def _intersect_horizontal(a: tuple[float, float], b: tuple[float, float], y: float) -> tuple[float, float]:
-    ax, ay, bx, by = a[0], a[1], b[0], b[1]
-    if abs(by - ay) < 1e-9:
-        return ((ax + bx) / 2, y)
-    t = (y - ay) / (by - ay)
-    t = max(0.0, min(1.0, t))
-    return (ax + t * (bx - ax), y)
+    step1 = _clip_polygon_half_plane_axis(vertices, 0, quadrant in (0, 3), cx)
+    return _clip_polygon_half_plane_axis(step1, 1, quadrant in (0, 1), cy)
 
 
 def build_partitioned_sections(
@@ -1437,6 +1867,11 @@ def build_partitioned_sections(
     if vertices and len(vertices) >= 3:
         vertices = _ensure_ccw(vertices)
     solid = {"solid_black": "#000", "grey": "#808080", "grey_light": "#d0d0d0", "white": "none", "white_fill": "#fff"}
+    # Bind the hot-loop globals once (LOAD_FAST beats LOAD_GLOBAL in the section loop)
+    cos, sin, pi = math.cos, math.sin, math.pi
+    circle_r = CIRCLE_RADIUS
+    num_sections = len(section_bounds)
+    cids = [f"{shape_clip_id}_sec{i}" for i in range(num_sections)]
     hatch_keys = ("diagonal_slash", "diagonal_backslash", "horizontal_lines", "vertical_lines")
     # ClipPath: use path in viewBox space. Sampling/vertices are never used for display (bbox only).
     rot = _parse_rotate_transform(symbol_transform) if symbol_transform else None
@@ -1450,7 +1885,9 @@ def build_partitioned_sections(
         path_el = f'<path d="{path_d}"/>'
     if rot is None and symbol_transform:
         path_el = f'<g transform="{symbol_transform}">{path_el}</g>'
-    defs_parts: list[str] = [f'  <defs><clipPath id="{shape_clip_id}">{path_el}</clipPath></defs>']
+    # clipPath entries are collected bare and wrapped in one <defs> block at
+    # the end, instead of emitting a <defs> element per section.
+    defs_parts: list[str] = [f'    <clipPath id="{shape_clip_id}">{path_el}</clipPath>']
     fill_parts: list[str] = []
     partition_lines: list[tuple[float, float, float, float]] = []
     partition_paths: list[str] = []
@@ -1460,11 +1897,11 @@ def build_partitioned_sections(
         if partition_direction == "horizontal":
             y_lo = y_min + (y_max - y_min) * lo / 100.0
             y_hi = y_min + (y_max - y_min) * hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 if vertices and len(vertices) >= 3:
                     partition_lines.append((x_min, y_hi, x_max, y_hi))
                 elif shape == "circle":
-                    cx, cy, r = 50.0, 50.0, CIRCLE_RADIUS
+                    cx, cy, r = 50.0, 50.0, circle_r
                     for seg in _clip_segment_to_circle(cx, cy, r, x_min, y_hi, x_max, y_hi):
                         partition_lines.append(seg)
                 else:
@@ -1472,30 +1909,33 @@ def build_partitioned_sections(
             if vertices and len(vertices) >= 3:
                 clip_verts = _clip_polygon_to_horizontal_band(vertices, y_lo, y_hi)
                 if clip_verts:
-                    section_path = _polygon_path_d(clip_verts)
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_polygon_path_d(clip_verts)}" fill="{solid[fill_key]}" stroke="none"/>')
+                    elif shape in _CONVEX_SHAPES:
+                        # Convex section: analytic hatch clip needs no clipPath def or path string
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", clip_verts)[1])
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                        section_path = _polygon_path_d(clip_verts)
+                        cid = cids[i]
+                        defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                         _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                         fill_parts.append(hatch_el)
             else:
                 h = y_hi - y_lo
-                section_path = f"M 0 {y_lo:.2f} h 100 v {h:.2f} h -100 Z"
+                section_path = _RECT_HORIZ_PATH_FMT((y_lo, h))
                 fill_parts.append(
                     f'  <g clip-path="url(#{shape_clip_id})">'
-                    f'<rect x="0" y="{y_lo:.2f}" width="100" height="{h:.2f}" fill="{solid.get(fill_key, "none")}" stroke="none"/>'
-                    "</g>"
+                    + _RECT_HORIZ_FMT((y_lo, h, solid.get(fill_key, "none")))
+                    + "</g>"
                 )
         elif partition_direction == "vertical":
             x_lo = x_min + (x_max - x_min) * lo / 100.0
             x_hi = x_min + (x_max - x_min) * hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 if vertices and len(vertices) >= 3:
                     partition_lines.append((x_hi, y_min, x_hi, y_max))
                 elif shape == "circle":
-                    cx, cy, r = 50.0, 50.0, CIRCLE_RADIUS
+                    cx, cy, r = 50.0, 50.0, circle_r
                     for seg in _clip_segment_to_circle(cx, cy, r, x_hi, y_min, x_hi, y_max):
                         partition_lines.append(seg)
                 else:
@@ -1503,42 +1943,50 @@ def build_partitioned_sections(
             if vertices and len(vertices) >= 3:
                 clip_verts = _clip_polygon_to_vertical_band(vertices, x_lo, x_hi)
                 if clip_verts:
-                    section_path = _polygon_path_d(clip_verts)
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_polygon_path_d(clip_verts)}" fill="{solid[fill_key]}" stroke="none"/>')
+                    elif shape in _CONVEX_SHAPES:
+                        # Convex section: analytic hatch clip needs no clipPath def or path string
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", clip_verts)[1])
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                        section_path = _polygon_path_d(clip_verts)
+                        cid = cids[i]
+                        defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                         _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                         fill_parts.append(hatch_el)
             else:
                 w = x_hi - x_lo
-                section_path = f"M {x_lo:.2f} 0 v 100 h {w:.2f} v -100 Z"
+                section_path = _RECT_VERT_PATH_FMT((x_lo, w))
                 fill_parts.append(
                     f'  <g clip-path="url(#{shape_clip_id})">'
-                    f'<rect x="{x_lo:.2f}" y="0" width="{w:.2f}" height="100" fill="{solid.get(fill_key, "none")}" stroke="none"/>'
-                    "</g>"
+                    + _RECT_VERT_FMT((x_lo, w, solid.get(fill_key, "none")))
+                    + "</g>"
                 )
         elif partition_direction == "diagonal_slash":
             sum_lo = (x_min + y_min) + ((x_max + y_max) - (x_min + y_min)) * lo / 100.0
             sum_hi = (x_min + y_min) + ((x_max + y_max) - (x_min + y_min)) * hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 px1 = max(x_min, min(x_max, sum_hi - y_max))
                 py1 = sum_hi - px1
                 px2 = min(x_max, max(x_min, sum_hi - y_min))
                 py2 = sum_hi - px2
-                if abs(px2 - px1) + abs(py2 - py1) > 0.1:
+                dx, dy = px2 - px1, py2 - py1
+                # Squared length beats the manhattan test: no abs() calls
+                if dx * dx + dy * dy > 0.01:
                     partition_lines.append((px1, py1, px2, py2))
             if vertices and len(vertices) >= 3:
                 s_lo, s_hi = min(sum_lo, sum_hi), max(sum_lo, sum_hi)
                 clip_verts = _clip_polygon_to_diagonal_slash_band(vertices, s_lo, s_hi)
                 if clip_verts:
-                    section_path = _polygon_path_d(clip_verts)
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_polygon_path_d(clip_verts)}" fill="{solid[fill_key]}" stroke="none"/>')
+                    elif shape in _CONVEX_SHAPES:
+                        # Convex section: analytic hatch clip needs no clipPath def or path string
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", clip_verts)[1])
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                        section_path = _polygon_path_d(clip_verts)
+                        cid = cids[i]
+                        defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                         _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                         fill_parts.append(hatch_el)
         elif partition_direction == "diagonal_backslash":
@@ -1546,108 +1994,115 @@ def build_partitioned_sections(
             diff_max = x_min - y_max
             diff_lo = diff_min + (diff_max - diff_min) * lo / 100.0
             diff_hi = diff_min + (diff_max - diff_min) * hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 px1 = max(x_min, min(x_max, diff_hi + y_min))
                 py1 = px1 - diff_hi
                 px2 = max(x_min, min(x_max, diff_hi + y_max))
                 py2 = px2 - diff_hi
-                if abs(px2 - px1) + abs(py2 - py1) > 0.1:
+                dx, dy = px2 - px1, py2 - py1
+                # Squared length beats the manhattan test: no abs() calls
+                if dx * dx + dy * dy > 0.01:
                     partition_lines.append((px1, py1, px2, py2))
             if vertices and len(vertices) >= 3:
                 k_lo, k_hi = min(diff_lo, diff_hi), max(diff_lo, diff_hi)
                 clip_verts = _clip_polygon_to_diagonal_backslash_band(vertices, k_lo, k_hi)
                 if clip_verts:
-                    section_path = _polygon_path_d(clip_verts)
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_polygon_path_d(clip_verts)}" fill="{solid[fill_key]}" stroke="none"/>')
+                    elif shape in _CONVEX_SHAPES:
+                        # Convex section: analytic hatch clip needs no clipPath def or path string
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", clip_verts)[1])
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                        section_path = _polygon_path_d(clip_verts)
+                        cid = cids[i]
+                        defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                         _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                         fill_parts.append(hatch_el)
         elif partition_direction == "concentric" and shape == "circle":
-            r = CIRCLE_RADIUS
+            r = circle_r
             cx, cy = 50.0, 50.0
             r_lo = r * lo / 100.0
             r_hi = r * hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 n_pts = 32
+                # One closed <path> for the ring instead of 32 <line> elements:
+                # same 32 points, a third of the serialized bytes, one DOM node.
+                pts = []
                 for k in range(n_pts):
-                    t0 = 2 * math.pi * k / n_pts
-                    t1 = 2 * math.pi * (k + 1) / n_pts
-                    seg = (cx + r_hi * math.cos(t0), cy + r_hi * math.sin(t0), cx + r_hi * math.cos(t1), cy + r_hi * math.sin(t1))
-                    partition_lines.append(seg)
+                    t = 2 * pi * k / n_pts
+                    pts.append((cx + r_hi * cos(t), cy + r_hi * sin(t)))
+                partition_paths.append(_polygon_path_d(pts))
             if r_lo < 1e-6:
-                section_path = f"M {cx} {cy - r_hi} A {r_hi} {r_hi} 0 0 1 {cx} {cy + r_hi} A {r_hi} {r_hi} 0 0 1 {cx} {cy - r_hi} Z"
+                fcx, frh = _fmt(cx), _fmt(r_hi)
+                section_path = f"M {fcx} {_fmt(cy - r_hi)} A {frh} {frh} 0 0 1 {fcx} {_fmt(cy + r_hi)} A {frh} {frh} 0 0 1 {fcx} {_fmt(cy - r_hi)} Z"
             else:
                 section_path = _circle_annulus_path(cx, cy, r_hi, r_lo)
             if fill_key in solid:
                 fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none" fill-rule="evenodd"/>')
             else:
-                cid = f"{shape_clip_id}_sec{i}"
+                cid = cids[i]
                 clip_rule = ' clip-rule="evenodd"' if r_lo >= 1e-6 else ""
-                defs_parts.append(f'  <defs><clipPath id="{cid}"{clip_rule}><path d="{section_path}"/></clipPath></defs>')
+                defs_parts.append(f'    <clipPath id="{cid}"{clip_rule}><path d="{section_path}"/></clipPath>')
                 _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                 fill_parts.append(hatch_el)
         elif partition_direction == "radial":
-            num_sections = len(section_bounds)
             if shape == "circle":
-                cx, cy, r = 50.0, 50.0, CIRCLE_RADIUS
-                angle_north = -math.pi / 2
-                angle_i = angle_north + i * 2 * math.pi / num_sections
-                angle_i1 = angle_north + (i + 1) * 2 * math.pi / num_sections
+                cx, cy, r = 50.0, 50.0, circle_r
+                angle_north = -pi / 2
+                angle_i = angle_north + i * 2 * pi / num_sections
+                angle_i1 = angle_north + (i + 1) * 2 * pi / num_sections
                 if i + 1 < num_sections:
-                    x1 = cx + r * math.cos(angle_i1)
-                    y1 = cy + r * math.sin(angle_i1)
+                    x1 = cx + r * cos(angle_i1)
+                    y1 = cy + r * sin(angle_i1)
                     partition_lines.append((cx, cy, x1, y1))
                 elif i == num_sections - 1:
-                    partition_lines.append((cx, cy, cx + r * math.cos(angle_north), cy + r * math.sin(angle_north)))
+                    partition_lines.append((cx, cy, cx + r * cos(angle_north), cy + r * sin(angle_north)))
                 section_path = _circle_wedge_path(cx, cy, r, angle_i, angle_i1)
                 if fill_key in solid:
                     fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
                 else:
-                    cid = f"{shape_clip_id}_sec{i}"
-                    defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                    cid = cids[i]
+                    defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                     _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                     fill_parts.append(hatch_el)
             elif shape == "semicircle":
                 cx, cy = 50.0, 67.5
                 r = SEMICIRCLE_RADIUS
-                angle_start = math.pi
-                angle_i = angle_start + i * math.pi / num_sections
-                angle_i1 = angle_start + (i + 1) * math.pi / num_sections
+                angle_start = pi
+                angle_i = angle_start + i * pi / num_sections
+                angle_i1 = angle_start + (i + 1) * pi / num_sections
                 if i + 1 < num_sections:
-                    x1 = cx + r * math.cos(angle_i1)
-                    y1 = cy + r * math.sin(angle_i1)
+                    x1 = cx + r * cos(angle_i1)
+                    y1 = cy + r * sin(angle_i1)
                     partition_lines.append((cx, cy, x1, y1))
                 elif i == num_sections - 1:
-                    partition_lines.append((cx, cy, cx + r * math.cos(angle_start), cy + r * math.sin(angle_start)))
+                    partition_lines.append((cx, cy, cx + r * cos(angle_start), cy + r * sin(angle_start)))
                 section_path = _circle_wedge_path(cx, cy, r, angle_i, angle_i1)
                 if fill_key in solid:
                     fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
                 else:
-                    cid = f"{shape_clip_id}_sec{i}"
-                    defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                    cid = cids[i]
+                    defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                     _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                     fill_parts.append(hatch_el)
             elif shape == "star" and num_sections == 5 and vertices and len(vertices) >= 3:
                 cx, cy = _polygon_centroid(vertices)
-                r = max(math.hypot(v[0] - cx, v[1] - cy) for v in vertices)
-                angle_north = -math.pi / 2
-                angle_i = angle_north + i * 2 * math.pi / 5
-                angle_i1 = angle_north + (i + 1) * 2 * math.pi / 5
+                r = math.sqrt(max((v[0] - cx) ** 2 + (v[1] - cy) ** 2 for v in vertices))
+                angle_north = -pi / 2
+                angle_i = angle_north + i * 2 * pi / 5
+                angle_i1 = angle_north + (i + 1) * 2 * pi / 5
                 if i + 1 < 5:
-                    x1 = cx + r * math.cos(angle_i1)
-                    y1 = cy + r * math.sin(angle_i1)
+                    x1 = cx + r * cos(angle_i1)
+                    y1 = cy + r * sin(angle_i1)
                     partition_lines.append((cx, cy, x1, y1))
                 elif i == 4:
-                    partition_lines.append((cx, cy, cx + r * math.cos(angle_north), cy + r * math.sin(angle_north)))
+                    partition_lines.append((cx, cy, cx + r * cos(angle_north), cy + r * sin(angle_north)))
                 section_path = _circle_wedge_path(cx, cy, r, angle_i, angle_i1)
                 if fill_key in solid:
                     fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
                 else:
-                    cid = f"{shape_clip_id}_sec{i}"
-                    defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
+                    cid = cids[i]
+                    defs_parts.append(f'    <clipPath id="{cid}"><path d="{section_path}"/></clipPath>')
                     _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                     fill_parts.append(hatch_el)
             elif vertices and len(vertices) >= 3:
@@ -1659,14 +2114,12 @@ def build_partitioned_sections(
                     idx1 = (i * step + 1) % sides
                     v0, v1 = vertices[idx0], vertices[idx1]
                     partition_lines.append((cx, cy, v1[0], v1[1]))
-                    section_path = f"M {cx:.2f} {cy:.2f} L {v0[0]:.2f} {v0[1]:.2f} L {v1[0]:.2f} {v1[1]:.2f} Z"
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_WEDGE_FMT((cx, cy, v0[0], v0[1], v1[0], v1[1]))}" fill="{solid[fill_key]}" stroke="none"/>')
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
-                        _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
-                        fill_parts.append(hatch_el)
+                        # Wedge triangle is convex: analytic hatch clip needs no path string
+                        wedge_verts = [(cx, cy), (v0[0], v0[1]), (v1[0], v1[1])]
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", wedge_verts)[1])
                 else:
                     if num_sections != 4:
                         raise ValueError("Radial partition for irregular shape requires exactly 4 sections.")
@@ -1678,14 +2131,11 @@ def build_partitioned_sections(
                     if i == 2:
                         partition_lines.append((cx, 0, cx, 100))
                     quad_verts = _quadrant_rect(cx, cy, i)
-                    section_path = _polygon_path_d(quad_verts)
                     if fill_key in solid:
-                        fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none"/>')
+                        fill_parts.append(f'  <path d="{_polygon_path_d(quad_verts)}" fill="{solid[fill_key]}" stroke="none"/>')
                     else:
-                        cid = f"{shape_clip_id}_sec{i}"
-                        defs_parts.append(f'  <defs><clipPath id="{cid}"><path d="{section_path}"/></clipPath></defs>')
-                        _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
-                        fill_parts.append(hatch_el)
+                        # Quadrant rectangle is convex: analytic hatch clip needs no path string
+                        fill_parts.append(hatch_continuous_defs_and_lines("", fill_key, "", quad_verts)[1])
             else:
                 raise ValueError("Segmented partition requires circle or polygon shape.")
         elif partition_direction == "concentric" and shape in SHAPES_SYMBOLS:
@@ -1701,15 +2151,15 @@ def build_partitioned_sections(
             outer_el = f'<path d="{esc(outer_d)}"/>'
             inner_el = f'<path d="{esc(inner_d)}"/>'
             # Internal boundary: use scaled shape path (same as fill), not polygon approximation.
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 partition_paths.append(outer_d)
-            cid = f"{shape_clip_id}_sec{i}"
+            cid = cids[i]
             if scale_lo < 1e-6:
-                defs_parts.append(f'  <defs><clipPath id="{cid}">{outer_el}</clipPath></defs>')
+                defs_parts.append(f'    <clipPath id="{cid}">{outer_el}</clipPath>')
             else:
                 clip_rule = ' clip-rule="evenodd"'
                 defs_parts.append(
-                    f'  <defs><clipPath id="{cid}"{clip_rule}>{outer_el}{inner_el}</clipPath></defs>'
+                    f'    <clipPath id="{cid}"{clip_rule}>{outer_el}{inner_el}</clipPath>'
                 )
             section_path_d = outer_d if scale_lo < 1e-6 else (outer_d + " " + inner_d)
             fill_color = "#fff" if (fill_key == "white" and scale_lo < 1e-6) else solid.get(fill_key, "none")
@@ -1723,12 +2173,10 @@ def build_partitioned_sections(
             cx, cy = _polygon_centroid(vertices)
             scale_lo = lo / 100.0
             scale_hi = hi / 100.0
-            if i + 1 < len(section_bounds):
+            if i + 1 < num_sections:
                 inner_verts = _scaled_polygon_vertices(vertices, cx, cy, scale_hi)
-                for j in range(len(inner_verts)):
-                    a = inner_verts[j]
-                    b = inner_verts[(j + 1) % len(inner_verts)]
-                    partition_lines.append((a[0], a[1], b[0], b[1]))
+                # Single closed path instead of one <line> per polygon edge
+                partition_paths.append(_polygon_path_d(inner_verts))
             if scale_lo < 1e-6:
                 section_path = _polygon_path_d(_scaled_polygon_vertices(vertices, cx, cy, scale_hi))
             else:
@@ -1736,17 +2184,19 @@ def build_partitioned_sections(
             if fill_key in solid:
                 fill_parts.append(f'  <path d="{section_path}" fill="{solid[fill_key]}" stroke="none" fill-rule="evenodd"/>')
             else:
-                cid = f"{shape_clip_id}_sec{i}"
+                cid = cids[i]
                 clip_rule = ' clip-rule="evenodd"' if scale_lo >= 1e-6 else ""
-                defs_parts.append(f'  <defs><clipPath id="{cid}"{clip_rule}><path d="{section_path}"/></clipPath></defs>')
+                defs_parts.append(f'    <clipPath id="{cid}"{clip_rule}><path d="{section_path}"/></clipPath>')
                 _, hatch_el = hatch_continuous_defs_and_lines(cid, fill_key, section_path)
                 fill_parts.append(hatch_el)
 
-    return ("\n".join(defs_parts), "\n".join(fill_parts), partition_lines, partition_paths)
+    defs_block = "  <defs>\n" + "\n".join(defs_parts) + "\n  </defs>"
+    return (defs_block, "\n".join(fill_parts), partition_lines, partition_paths)
 
 
-def _hatch_lines(fill_key: str) -> list[tuple[float, float, float, float]]:
-    """Return list of (x1, y1, x2, y2) for full viewBox-spanning lines."""
+@functools.lru_cache(maxsize=8)
+def _hatch_lines(fill_key: str) -> tuple[tuple[float, float, float, float], ...]:
+    """Return (x1, y1, x2, y2) tuples for full viewBox-spanning lines. The sets depend only on the fill key and module spacing constants, so each is built once per process."""
     s = HATCH_SPACING_HV if fill_key in ("horizontal_lines", "vertical_lines") else HATCH_SPACING
     out: list[tuple[float, float, float, float]] = []
     if fill_key == "diagonal_slash":
@@ -1769,19 +2219,83 @@ def _hatch_lines(fill_key: str) -> list[tuple[float, float, float, float]]:
         while k <= 100:
             out.append((k, 0, k, 100))
             k += s
-    return out
+    return tuple(out)
+
+
+# Line elements are emitted in bulk (hatches especially), so they use
+# %-formatting: one C-level call per line instead of four float __format__
+# calls, and the hatch join runs through map() without a Python-level loop.
+_HATCH_LINE_FMT = (
+    f'    <line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke="#000" stroke-width="{HATCH_STROKE}" stroke-linecap="round"/>'
+).__mod__
+_PARTITION_LINE_FMT = (
+    f'  <line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke="#000" stroke-width="{PARTITION_LINE_STROKE}" stroke-linecap="round"/>'
+).__mod__
+_WEDGE_FMT = "M %.2f %.2f L %.2f %.2f L %.2f %.2f Z".__mod__
+_RECT_HORIZ_PATH_FMT = "M 0 %.2f h 100 v %.2f h -100 Z".__mod__
+_RECT_HORIZ_FMT = '<rect x="0" y="%.2f" width="100" height="%.2f" fill="%s" stroke="none"/>'.__mod__
+_RECT_VERT_PATH_FMT = "M %.2f 0 v 100 h %.2f v -100 Z".__mod__
+_RECT_VERT_FMT = '<rect x="%.2f" y="0" width="%.2f" height="100" fill="%s" stroke="none"/>'.__mod__
+
+
+def hatch_continuous_defs_and_lines(clip_id: str, fill_key: str, path_d: str, clip_verts: list[tuple[float, float]] | None = None) -> tuple[str, str]:
+    """Continuous hatch lines clipped to shape path. With clip_verts (a convex CCW polygon) the lines are clipped analytically instead: only the visible segments are emitted and no clipPath def is used, so partitioned SVGs skip serializing off-section lines."""
+    if clip_verts is not None:
+        segs: list[tuple[float, float, float, float]] = []
+        for x1, y1, x2, y2 in _hatch_lines(fill_key):
+            segs.extend(_clip_segment_to_polygon(x1, y1, x2, y2, clip_verts))
+        line_elts = "\n".join(map(_HATCH_LINE_FMT, segs))
+        return "", f'  <g fill="none">\n{line_elts}\n  </g>'
+    defs_str = f'  <defs><clipPath id="{clip_id}"><path d="{path_d}"/></clipPath></defs>'
+    return defs_str, f'  <g clip-path="url(#{clip_id})" fill="none">\n{_hatch_line_elts(fill_key)}\n  </g>'
 
 
-def hatch_continuous_defs_and_lines(clip_id: str, fill_key: str, path_d: str) -> tuple[str, str]:
-    """Continuous hatch lines clipped to shape path."""
-    line_coords = _hatch_lines(fill_key)
-    stroke = HATCH_STROKE
-    defs_str = f'  <defs><clipPath id="{clip_id}"><path d="{path_d}"/></clipPath></defs>'
-    line_elts = "\n".join(
-        f'    <line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="#000" stroke-width="{stroke}" stroke-linecap="round"/>'
-        for x1, y1, x2, y2 in line_coords
+@functools.lru_cache(maxsize=8)
+def _hatch_line_elts(fill_key: str) -> str:
+    """The serialized full-viewBox hatch lines for a fill key. The string depends only on the key, so it is formatted once per process."""
+    return "\n".join(map(_HATCH_LINE_FMT, _hatch_lines(fill_key)))
+
+
+def _build_svg_simple(
+    motif_content: str,
+    positions: list[tuple[float, float]],
+    motif_name: str,
+    shape: str,
+    path_d: str,
+    motif_scale: float,
+    motif_tx: float,
+    motif_ty: float,
+    line_style: str,
+    polygon_fill: str,
+    motif_fill: str,
+    symbol_transform: str | None,
+) -> str:
+    """Fast path of build_svg for the plain unpartitioned container: one shape path, then the motifs. Emits byte-identical output to the general path for this case."""
+    stroke_dasharray = {"solid": "", "dashed": "8 4", "dotted": "2 4"}.get(line_style, "")
+    dash_attr = f' stroke-dasharray="{stroke_dasharray}"' if stroke_dasharray else ""
+    fill_rule_attr = ' fill-rule="evenodd"' if (shape or "").strip().lower() == "cross" else ""
+    shape_el = f'  <path d="{path_d}" fill="{polygon_fill}" stroke-width="2" {dash_attr}{fill_rule_attr} />'
+    lines = [
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100" fill="none" stroke="#000" stroke-linecap="round" stroke-linejoin="round">',
+        f"  <!-- {shape} container, {line_style}, fill; {len(positions)} {motif_name} motifs -->",
+    ]
+    if symbol_transform:
+        lines.extend((f'  <g transform="{symbol_transform}">', shape_el, "  </g>"))
+    else:
+        lines.append(shape_el)
+    motif_stroke = "#000" if motif_fill == "#fff" else motif_fill
+    motif_block = "\n".join(
+        "    " + _MOTIF_FILL_NONE_RE.sub(f'fill="{motif_fill}"', line)
+        for line in motif_content.split("\n")
     )
-    return defs_str, f'  <g clip-path="url(#{clip_id})" fill="none">\n{line_elts}\n  </g>'
+    for cx, cy in positions:
+        lines.extend((
+            f'  <g transform="translate({cx:.2f}, {cy:.2f}) scale({motif_scale:.4f}) translate({motif_tx:.2f},{motif_ty:.2f})" fill="{motif_fill}" stroke="{motif_stroke}">',
+            motif_block,
+            "  </g>",
+        ))
+    lines.append("</svg>")
+    return "\n".join(lines)
 
 
 def build_svg(
@@ -1808,6 +2322,20 @@ def build_svg(
     shape_clip_id: str = "shapeClip",
 ) -> str:
     """Build shape-container SVG. For cross use stroke_lines (12 segments); else path_d_stroke or single path. symbol_transform wraps the shape path when present (e.g. times = plus rotated 45°). Partition (guide §3.9) optional; partition_paths are path d strings for curved separators (e.g. symbol concentric). Motifs are rendered with motif_fill (default black; guide §3.2 allows fill variation)."""
+    if (
+        partition_defs is None
+        and partition_fill_content is None
+        and polygon_fill_defs is None
+        and polygon_hatch_lines is None
+        and path_d_stroke is None
+        and stroke_lines is None
+    ):
+        # Common case: plain container with motifs — skip the partition branches.
+        return _build_svg_simple(
+            motif_content, positions, motif_name, shape, path_d,
+            motif_scale, motif_tx, motif_ty, line_style, polygon_fill,
+            motif_fill, symbol_transform,
+        )
     stroke_dasharray = {"solid": "", "dashed": "8 4", "dotted": "2 4"}.get(line_style, "")
     dash_attr = f' stroke-dasharray="{stroke_dasharray}"' if stroke_dasharray else ""
     is_cross = (shape or "").strip().lower() == "cross"
@@ -1846,8 +2374,7 @@ def build_svg(
             lines.extend(wrap_shape([path_line("none")]))
         if partition_lines or partition_paths:
             lines.append(f'  <g clip-path="url(#{shape_clip_id})">')
-            for x1, y1, x2, y2 in (partition_lines or []):
-                lines.append(f'  <line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="#000" stroke-width="{PARTITION_LINE_STROKE}" stroke-linecap="round"/>')
+            lines.extend(map(_PARTITION_LINE_FMT, partition_lines or []))
             for path_d in (partition_paths or []):
                 esc = path_d.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;")
                 lines.append(f'  <path d="{esc}" fill="none" stroke="#000" stroke-width="{PARTITION_LINE_STROKE}" stroke-linecap="round" stroke-linejoin="round"/>')
@@ -1869,18 +2396,25 @@ def build_svg(
             lines.extend(wrap_shape([path_line(polygon_fill)]))
     # Motifs: fill and stroke per --motif-fill. White motifs = white fill, black outline; black motifs = black fill and stroke.
     motif_stroke = "#000" if motif_fill == "#fff" else motif_fill
-    motif_fill_override = re.compile(r'\bfill="none"', re.IGNORECASE)
+    # The motif body is identical for every position: substitute the fill and
+    # indent it once, then emit the prepared block per position instead of
+    # re-running the regex and re-copying each line count times.
+    motif_block = "\n".join(
+        "    " + _MOTIF_FILL_NONE_RE.sub(f'fill="{motif_fill}"', line)
+        for line in motif_content.split("\n")
+    )
     for cx, cy in positions:
-        lines.append(f'  <g transform="translate({cx:.2f}, {cy:.2f}) scale({motif_scale:.4f}) translate({motif_tx:.2f},{motif_ty:.2f})" fill="{motif_fill}" stroke="{motif_stroke}">')
-        for line in motif_content.split("\n"):
-            line = motif_fill_override.sub(f'fill="{motif_fill}"', line)
-            lines.append("    " + line)
-        lines.append("  </g>")
+        lines.extend((
+            f'  <g transform="translate({cx:.2f}, {cy:.2f}) scale({motif_scale:.4f}) translate({motif_tx:.2f},{motif_ty:.2f})" fill="{motif_fill}" stroke="{motif_stroke}">',
+            motif_block,
+            "  </g>",
+        ))
     lines.append("</svg>")
     return "\n".join(lines)
 
 
-def main() -> None:
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser. Exposed separately from render() so batch drivers can construct a namespace and render in-process instead of paying interpreter start-up per subprocess call."""
     script_dir = Path(__file__).resolve().parent
     # When run from lib/, nvr-symbols is at repo root.
     _repo_root = script_dir.parent.parent if script_dir.name == "lib" else script_dir.parent
@@ -1985,7 +2519,12 @@ def main() -> None:
         metavar="FILLS",
         help="Comma-separated fill keys per section (cycle if fewer than sections), e.g. white,grey,null,diagonal_slash. null = section not drawn (guide §3.9).",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def render(args: argparse.Namespace) -> None:
+    """Render one container SVG from a parsed namespace (see build_parser). Same behaviour as the CLI, callable in-process."""
+    script_dir = Path(__file__).resolve().parent
     args.shape = (args.shape or "square").strip().lower()
 
     if not args.empty and args.motif is None and not args.partition:
@@ -2077,47 +2616,16 @@ def main() -> None:
             raise SystemExit(f"Motif file not found: {motif_path}")
         motif_content, motif_scale, motif_tx, motif_ty = load_motif_content(motif_path)
         motif_name = args.motif
+        inside_check = make_inside_check(args.shape, vertices)
 
-        def inside_check(cx: float, cy: float) -> bool:
-            if args.shape == "circle":
-                return math.hypot(cx - 50, cy - 50) <= CIRCLE_RADIUS - CELL_HALF
-            if args.shape == "semicircle":
-                # Vertically centred: circle centre (50, 67.5), flat at bottom (y=67.5). Inside with margin.
-                cy_centre = 67.5
-                arc_top_y = cy_centre - SEMICIRCLE_RADIUS
-                if math.hypot(cx - 50, cy - cy_centre) > SEMICIRCLE_RADIUS - CELL_HALF:
-                    return False
-                if cy > cy_centre - CELL_HALF or cy < arc_top_y + CELL_HALF:  # margin from flat and from arc top
-                    return False
-                return True
-            if args.shape == "cross":
-                # Only inside the cross (center + 4 arms); exclude corners; keep clear of notches (CROSS_EDGE_MARGIN)
-                if not _point_in_cross(cx, cy):
-                    return False
-                return min_distance_to_edges((cx, cy), vertices) >= CROSS_EDGE_MARGIN
-            if vertices:
-                use_convex = args.shape in ("square", "triangle", "pentagon", "hexagon", "heptagon", "octagon", "right_angled_triangle", "rectangle")
-                margin = TRIANGLE_EDGE_MARGIN if args.shape == "triangle" else CELL_HALF
-                if use_convex:
-                    ok = point_in_convex_polygon((cx, cy), vertices) and min_distance_to_edges((cx, cy), vertices) >= margin
-                else:
-                    ok = point_in_polygon_ray((cx, cy), vertices) and min_distance_to_edges((cx, cy), vertices) >= margin
-                return ok
-            return False
-
-        if args.shape == "circle":
-            bounds = (50 - CIRCLE_RADIUS, 50 + CIRCLE_RADIUS, 50 - CIRCLE_RADIUS, 50 + CIRCLE_RADIUS)
-        elif args.shape == "semicircle":
+        if args.shape == "semicircle":
             # Vertically centred: arc top at 67.5 - SEMICIRCLE_RADIUS, flat at 67.5; use inner bounds with margin for sampling
             arc_top_y = 67.5 - SEMICIRCLE_RADIUS
             bounds = (50 - SEMICIRCLE_RADIUS, 50 + SEMICIRCLE_RADIUS, arc_top_y + CELL_HALF, 67.5 - CELL_HALF)
-        elif vertices:
-            bounds = (
-                min(v[0] for v in vertices),
-                max(v[0] for v in vertices),
-                min(v[1] for v in vertices),
-                max(v[1] for v in vertices),
-            )
+        elif args.shape == "circle" or vertices:
+            # bbox is already (x_min, x_max, y_min, y_max) over the same
+            # geometry; no need to rescan the vertices here.
+            bounds = bbox
         else:
             bounds = (MIN_CENTRE, MAX_CENTRE, MIN_CENTRE, MAX_CENTRE)
         if args.layout_symmetry:
@@ -2132,7 +2640,10 @@ def main() -> None:
         else:
             # Cross: sample only from the five rectangles so motifs never land in the missing corners
             sample_pt = _cross_sample_point if args.shape == "cross" else None
-            cross_attempts = 8000 if args.shape == "cross" else None  # cross has tight regions, need more tries
+            # Cross samples land inside the shape by construction now, but dense
+            # counts still reject heavily on min-distance, so the bigger budget
+            # measurably cuts placement failures (e.g. n=8: 29 -> 18 per 300 seeds).
+            cross_attempts = 8000 if args.shape == "cross" else None
             positions = random_positions(
                 args.count, seed=args.seed, inside_check=inside_check, bounds=bounds, sample_point=sample_pt, max_attempts=cross_attempts
             )
@@ -2173,12 +2684,16 @@ def main() -> None:
             out_name = {"club": "clubs", "spade": "spades"}.get(args.motif, args.motif)
             out = out_dir / f"option-{args.shape}-{args.count}-{out_name}.svg"
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(svg, encoding="utf-8")
+    out.write_bytes(svg.encode("utf-8"))
     if args.empty:
         print(f"Wrote {out} (shape only).")
     else:
         print(f"Wrote {out} ({len(positions)} motifs).")
 
 
+def main() -> None:
+    render(build_parser().parse_args())
+
+
 if __name__ == "__main__":
     main()
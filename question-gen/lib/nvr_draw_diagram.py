@@ -131,7 +131,7 @@ def main() -> int:
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
-        out.write_text(svg, encoding="utf-8")
+        out.write_bytes(svg.encode("utf-8"))
         print(f"Wrote {out}")
         return 0
 
@@ -148,7 +148,7 @@ def main() -> int:
         except ValueError as e:
             print(f"Error rendering {label}: {e}", file=sys.stderr)
             continue
-        path.write_text(svg, encoding="utf-8")
+        path.write_bytes(svg.encode("utf-8"))
         print(f"Wrote {path}")
 
     return 0
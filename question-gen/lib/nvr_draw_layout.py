@@ -304,11 +304,12 @@ def _scatter_positions(n: int, margin: float, min_dist: float, rng: random.Rando
     """Place n centres in [margin, 100-margin] with min_dist between them. Simple rejection sampling."""
     positions: list[tuple[float, float]] = []
     max_attempts = 2000
+    min_dist_sq = min_dist * min_dist
     for _ in range(n):
         for _ in range(max_attempts):
             cx = rng.uniform(margin, 100 - margin)
             cy = rng.uniform(margin, 100 - margin)
-            if all(math.hypot(cx - px, cy - py) >= min_dist for px, py in positions):
+            if all((cx - px) * (cx - px) + (cy - py) * (cy - py) >= min_dist_sq for px, py in positions):
                 positions.append((cx, cy))
                 break
         else:
@@ -511,7 +512,7 @@ def _loop_scaled_vertices(
         return []
     if not vertices:
         return []
-    max_radius = max(math.hypot(v[0] - 50.0, v[1] - 50.0) for v in vertices)
+    max_radius = math.sqrt(max((v[0] - 50.0) ** 2 + (v[1] - 50.0) ** 2 for v in vertices))
     if max_radius < 1e-6:
         return []
     scale_factor = radius / max_radius
@@ -589,7 +590,7 @@ def _loop_path_svg(
         return f'  <circle cx="50" cy="50" r="{radius:.2f}" fill="none" stroke="#000" stroke-width="{stroke_width}"{dash_str} />'
     # Scale so the path's bounding radius equals our loop radius (matches circle used for placement)
     if vertices:
-        max_radius = max(math.hypot(v[0] - 50.0, v[1] - 50.0) for v in vertices)
+        max_radius = math.sqrt(max((v[0] - 50.0) ** 2 + (v[1] - 50.0) ** 2 for v in vertices))
     else:
         max_radius = 50.0
     if max_radius < 1e-6:
@@ -711,9 +712,10 @@ def _scatter_inside_shape_inside_check(
         # Centre (50, 50), radius from bbox
         r = (x_max - x_min) / 2.0
         cx_centre, cy_centre = 50.0, 50.0
+        r2 = max(r - margin, 0.0) ** 2
 
         def inside_check(cx: float, cy: float) -> bool:
-            return math.hypot(cx - cx_centre, cy - cy_centre) <= r - margin
+            return (cx - cx_centre) ** 2 + (cy - cy_centre) ** 2 <= r2
 
         bounds = (x_min, x_max, y_min, y_max)
         return inside_check, bounds
@@ -722,9 +724,10 @@ def _scatter_inside_shape_inside_check(
         cy_centre = 67.5
         r = container.SEMICIRCLE_RADIUS
         arc_top_y = cy_centre - r
+        r2 = max(r - margin, 0.0) ** 2
 
         def inside_check(cx: float, cy: float) -> bool:
-            if math.hypot(cx - 50, cy - cy_centre) > r - margin:
+            if (cx - 50) ** 2 + (cy - cy_centre) ** 2 > r2:
                 return False
             if cy > cy_centre - margin or cy < arc_top_y + margin:
                 return False
@@ -738,11 +741,19 @@ def _scatter_inside_shape_inside_check(
             bounds = (x_min, x_max, y_min, y_max)
             return (lambda cx, cy: x_min + margin <= cx <= x_max - margin and y_min + margin <= cy <= y_max - margin), bounds
         dist_margin = getattr(container, "CROSS_EDGE_MARGIN", margin)
+        # Inset bbox prefilter: points with dist_margin clearance from every edge always lie inside it
+        ins_lo_x, ins_hi_x = x_min + dist_margin, x_max - dist_margin
+        ins_lo_y, ins_hi_y = y_min + dist_margin, y_max - dist_margin
+
+        cross_edges = container._prepare_polygon_edges(tuple(vertices))
+        dist_margin_sq = dist_margin * dist_margin
 
         def inside_check(cx: float, cy: float) -> bool:
+            if not (ins_lo_x <= cx <= ins_hi_x and ins_lo_y <= cy <= ins_hi_y):
+                return False
             if not container._point_in_cross(cx, cy):
                 return False
-            return container.min_distance_to_edges((cx, cy), vertices) >= dist_margin
+            return container._edges_clear_of(cx, cy, cross_edges, dist_margin_sq)
 
         bounds = (x_min, x_max, y_min, y_max)
         return inside_check, bounds
@@ -754,15 +765,28 @@ def _scatter_inside_shape_inside_check(
         )
         # Use at least margin (needed so shape fits); triangle may add extra buffer via TRIANGLE_EDGE_MARGIN
         edge_margin = max(margin, container.TRIANGLE_EDGE_MARGIN if key == "triangle" else 0)
+        # Inset bbox prefilter: points with edge_margin clearance from every edge always lie inside it
+        ins_lo_x, ins_hi_x = x_min + edge_margin, x_max - edge_margin
+        ins_lo_y, ins_hi_y = y_min + edge_margin, y_max - edge_margin
+
+        # Table-based predicates from the container module: edge vectors and
+        # ray slopes are precomputed once per polygon, and the convex/ray
+        # choice is resolved here instead of per candidate.
+        edges = container._prepare_polygon_edges(tuple(vertices))
+        edge_margin_sq = edge_margin * edge_margin
+        if use_convex:
+            def contains(cx: float, cy: float) -> bool:
+                return container._point_in_convex_edges(cx, cy, edges)
+        else:
+            ray_tab = container._prepare_polygon_ray(tuple(vertices))
+
+            def contains(cx: float, cy: float) -> bool:
+                return container._point_in_polygon_ray_tab(cx, cy, ray_tab)
 
         def inside_check(cx: float, cy: float) -> bool:
-            if use_convex:
-                ok = container.point_in_convex_polygon((cx, cy), vertices)
-            else:
-                ok = container.point_in_polygon_ray((cx, cy), vertices)
-            if not ok:
+            if not (ins_lo_x <= cx <= ins_hi_x and ins_lo_y <= cy <= ins_hi_y):
                 return False
-            return container.min_distance_to_edges((cx, cy), vertices) >= edge_margin
+            return contains(cx, cy) and container._edges_clear_of(cx, cy, edges, edge_margin_sq)
 
         bounds = (x_min, x_max, y_min, y_max)
         return inside_check, bounds
@@ -1140,7 +1164,7 @@ def main() -> int:
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
-        out.write_text(svg, encoding="utf-8")
+        out.write_bytes(svg.encode("utf-8"))
         print(f"Wrote {out}")
         return 0
 
@@ -1156,7 +1180,7 @@ def main() -> int:
         except ValueError as e:
             print(f"Skipping {label}: {e}", file=sys.stderr)
             continue
-        path.write_text(svg, encoding="utf-8")
+        path.write_bytes(svg.encode("utf-8"))
         print(f"Wrote {path}")
 
     return 0
@@ -5,6 +5,9 @@ Templates use **common**, **uncommon**, and **rare** to set probabilities.
 This module provides reusable weighted sampling for all question templates.
 """
 
+import bisect
+import functools
+import itertools
 import random
 from typing import Any, Optional, Sequence
 
@@ -20,8 +23,9 @@ FREQUENCY_WEIGHTS: dict[str, float] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def weight_for(frequency: str) -> float:
-    """Return weight for a frequency label. Unknown labels default to common (1.0)."""
+    """Return weight for a frequency label. Unknown labels default to common (1.0). Cached: templates pass the same handful of labels over and over."""
     return FREQUENCY_WEIGHTS.get(frequency.strip().lower(), WEIGHT_COMMON)
 
 
@@ -39,17 +43,16 @@ def weighted_choice(
     """
     if not choices:
         raise ValueError("weighted_choice requires at least one choice")
-    weights = [weight_for(freq) for _, freq in choices]
-    total = sum(weights)
+    cum = list(itertools.accumulate(weight_for(freq) for _, freq in choices))
+    total = cum[-1]
     if total <= 0:
         raise ValueError("total weight must be positive")
-    r = rng.uniform(0.0, total)
-    acc = 0.0
-    for (item, _), w in zip(choices, weights):
-        acc += w
-        if r <= acc:
-            return item
-    return choices[-1][0]
+    # First cumulative weight >= r — same pick as the old linear scan,
+    # found by bisection instead.
+    idx = bisect.bisect_left(cum, rng.random() * total)
+    if idx >= len(choices):
+        idx = len(choices) - 1
+    return choices[idx][0]
 
 
 def weighted_choice_from_pool(
@@ -66,3 +69,21 @@ def weighted_choice_from_pool(
     freq_map = frequency_by_item or {}
     choices = [(item, freq_map.get(item, "common")) for item in pool]
     return weighted_choice(rng, choices)
+
+
+class WeightedSampler:
+    """Reusable weighted sampler over fixed (item, frequency) pairs. Builds the cumulative weights once; pick() is then a single bisection, for callers that draw repeatedly from the same choices."""
+
+    def __init__(self, choices: Sequence[tuple[Any, str]]):
+        if not choices:
+            raise ValueError("WeightedSampler requires at least one choice")
+        self._items = [item for item, _ in choices]
+        self._cum = list(itertools.accumulate(weight_for(freq) for _, freq in choices))
+        if self._cum[-1] <= 0:
+            raise ValueError("total weight must be positive")
+
+    def pick(self, rng: random.Random) -> Any:
+        idx = bisect.bisect_left(self._cum, rng.random() * self._cum[-1])
+        if idx >= len(self._items):
+            idx = len(self._items) - 1
+        return self._items[idx]
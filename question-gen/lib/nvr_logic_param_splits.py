@@ -6,6 +6,7 @@ allowed splits so no single option is uniquely different. This module defines al
 number of options and provides sampling/assignment helpers.
 """
 
+import functools
 import random
 from typing import Optional
 
@@ -29,6 +30,12 @@ def sample_split(
 ) -> tuple[int, ...]:
     """Return a random allowed split for n_options (e.g. (2, 3) or (3, 1, 1) for 5). If max_values is set, only return splits that need at most that many distinct values (len(split) <= max_values)."""
     rng = rng or random.Random()
+    return rng.choice(_filtered_splits(n_options, max_values))
+
+
+@functools.lru_cache(maxsize=None)
+def _filtered_splits(n_options: int, max_values: Optional[int]) -> tuple[tuple[int, ...], ...]:
+    """Allowed splits for n_options filtered by max_values, memoized: the (n_options, max_values) key space is tiny and sample_split sits in the question generation loop."""
     splits = ALLOWED_SPLITS.get(n_options)
     if not splits:
         raise ValueError(f"No allowed splits for n_options={n_options}")
@@ -36,7 +43,7 @@ def sample_split(
         splits = [s for s in splits if len(s) <= max_values]
         if not splits:
             raise ValueError(f"No allowed split for n_options={n_options} with max_values={max_values}")
-    return rng.choice(splits)
+    return tuple(splits)
 
 
 def assign_split_to_indices(
@@ -52,9 +59,15 @@ def assign_split_to_indices(
     rng = rng or random.Random()
     if sum(split) != n_options:
         raise ValueError(f"Split {split} does not sum to n_options={n_options}")
-    # Build list of value indices: split[0] copies of 0, split[1] copies of 1, ...
+    indices = list(_unshuffled_indices(split))
+    rng.shuffle(indices)
+    return indices
+
+
+@functools.lru_cache(maxsize=32)
+def _unshuffled_indices(split: tuple[int, ...]) -> tuple[int, ...]:
+    """Value indices before shuffling: split[0] copies of 0, split[1] copies of 1, ... Cached — the allowed splits are a small fixed set and pipelines assign them per variator per question."""
     indices: list[int] = []
     for val_idx, count in enumerate(split):
         indices.extend([val_idx] * count)
-    rng.shuffle(indices)
-    return indices
+    return tuple(indices)
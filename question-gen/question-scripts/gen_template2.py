@@ -28,13 +28,13 @@ sys.path.insert(0, str(SCRIPT_DIR.parent / "lib"))
 try:
     import nvr_draw_container_svg as draw_lib
     from nvr_logic_param_splits import assign_split_to_indices, sample_split
-    from nvr_logic_frequency import weighted_choice
+    from nvr_logic_frequency import WeightedSampler
 except ImportError:
     # Fallback for direct execution if paths are messy
     sys.path.append(str(SCRIPT_DIR.parent / "lib"))
     import nvr_draw_container_svg as draw_lib
     from nvr_logic_param_splits import assign_split_to_indices, sample_split
-    from nvr_logic_frequency import weighted_choice
+    from nvr_logic_frequency import WeightedSampler
 
 N_OPTIONS = 5
 
@@ -81,6 +81,9 @@ DIFF_WEIGHTS = [
     ("fill", "uncommon"),
 ]
 
+# Fixed choices, so build the cumulative weights once and bisect per question
+_DIFF_SAMPLER = WeightedSampler(DIFF_WEIGHTS)
+
 def _generate_value_indices(
     n_options: int,
     is_differentiator: bool,
@@ -124,7 +127,7 @@ def generate_question(seed: int) -> dict:
     # Filter available differentiators based on constraints?
     # e.g. if num_sections is 2, maybe we don't have enough partition types?
     # Usually fine.
-    diff_attr = weighted_choice(rng, DIFF_WEIGHTS)
+    diff_attr = _DIFF_SAMPLER.pick(rng)
     
     # 3. Determine Values
     correct_idx = rng.randint(0, N_OPTIONS - 1)
@@ -361,7 +364,11 @@ def main():
     parser.add_argument("--seed", type=int, default=None)
     args = parser.parse_args()
     
-    rng = random.Random(args.seed)
+    # One RNG per run. Per-question seeds recorded in the output still go
+    # through generate_question(seed) so questions stay reproducible from
+    # their recorded seed alone.
+    run_seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    rng = random.Random(run_seed)
     
     # Batch mode check: -o is a directory and count is implicitly 1 (or we just take 1)
     # The batch runner passes --seed X -o DIR
@@ -370,7 +377,7 @@ def main():
     if output_path and (output_path.is_dir() or not output_path.suffix):
         # Directory mode (Batch Runner)
         # Generate 1 question
-        seed = args.seed if args.seed is not None else rng.randint(0, 2**32 - 1)
+        seed = run_seed
         q = generate_question(seed)
         
         if not output_path.exists():
@@ -405,13 +412,8 @@ def main():
         # File mode (XML)
         questions = []
         count = args.count if args.count else 1
-        # If seed is provided in file mode, we usually want deterministic sequence
-        current_seed = args.seed if args.seed is not None else rng.randint(0, 2**32 - 1)
-        
-        local_rng = random.Random(current_seed)
-        
         for _ in range(count):
-            s = local_rng.randint(0, 2**32 - 1)
+            s = rng.randint(0, 2**32 - 1)
             q = generate_question(s)
             questions.append(q)
             
@@ -294,12 +294,16 @@ def main():
     parser.add_argument("--seed", type=int, default=None)
     args = parser.parse_args()
     
-    rng = random.Random(args.seed)
+    # One RNG per run. Per-question seeds recorded in the output still go
+    # through generate_question(seed) so questions stay reproducible from
+    # their recorded seed alone.
+    run_seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    rng = random.Random(run_seed)
     
     output_path = args.output
     if output_path and (output_path.is_dir() or not output_path.suffix):
         # Batch Mode
-        seed = args.seed if args.seed is not None else rng.randint(0, 2**32 - 1)
+        seed = run_seed
         try:
             q = generate_question(seed)
         except RuntimeError as e:
@@ -335,11 +339,9 @@ def main():
         # File/Stdout Mode
         questions = []
         count = args.count if args.count else 1
-        current_seed = args.seed if args.seed is not None else rng.randint(0, 2**32 - 1)
-        local_rng = random.Random(current_seed)
         
         for _ in range(count):
-            s = local_rng.randint(0, 2**32 - 1)
+            s = rng.randint(0, 2**32 - 1)
             try:
                 q = generate_question(s)
                 questions.append(q)
@@ -0,0 +1,19 @@
+-- =====================================================
+-- Add external_id to questions for idempotent batch inserts
+-- =====================================================
+-- Migration for existing databases created with create_11plus_supabase.sql.
+-- external_id holds the generator's question id (e.g. q00001) so that
+-- re-running batch_upload_and_insert_questions.py with --on-conflict-skip
+-- can skip questions that were already inserted instead of duplicating them.
+--
+-- Usage: Paste into Supabase Dashboard → SQL Editor → Run
+-- =====================================================
+
+ALTER TABLE questions ADD COLUMN IF NOT EXISTS external_id VARCHAR(100);
+
+-- Natural key for batch reruns: the same generated question under the same
+-- subject/topic may only exist once. Partial so hand-inserted rows without
+-- an external_id are unaffected.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_external_id
+    ON questions(subject_id, topic_id, external_id)
+    WHERE external_id IS NOT NULL;